@@ -4,9 +4,6 @@ import json
 
 import click
 
-from .config import load_settings
-from .pipeline import run_pipeline
-
 
 @click.command(context_settings={"help_option_names": ["-h", "--help"]})
 @click.option("--home-lat", type=float, help="Home latitude override")
@@ -22,8 +19,13 @@ from .pipeline import run_pipeline
 @click.option("--user-agent", type=str, help="Custom user agent")
 @click.option("--no-cache", is_flag=True, help="Force re-download of data")
 @click.option("--html-only", is_flag=True, help="Skip email even if credentials exist")
+@click.option("--png/--no-png", "png", default=None, help="Render the PNG snapshot (slow; off by default)")
 def main(**kwargs):
     """Run the dual-path EHS forecast pipeline."""
+    # Deferred so `--help` and option errors don't pay for the ingest/report stack.
+    from .config import load_settings
+    from .pipeline import run_pipeline
+
     settings = load_settings(kwargs)
     summary = run_pipeline(settings)
     click.echo(
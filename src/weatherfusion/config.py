@@ -1,121 +1,172 @@
 from __future__ import annotations
 
+import html
 import json
 import os
-from dataclasses import dataclass
+import re
+import tempfile
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Literal, Optional
+from typing import TYPE_CHECKING, Any, Literal, Mapping, Optional
 from urllib.parse import parse_qs, urlparse
 
-import requests
-from bs4 import BeautifulSoup
-from dotenv import load_dotenv
-from pydantic import BaseModel, Field, ValidationError
 
-from zoneinfo import ZoneInfo
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import requests
 
 DEFAULT_USER_AGENT = "ForecastAggregator/1.0 (contact: you@example.com)"
 ZIPCITY_URL = "https://forecast.weather.gov/zipcity.php"
+GEOCODE_CACHE_NAME = "geocode_cache.json"
+_ADDR_PUNCT_RE = re.compile(r"[^\w\s]")
+_ADDR_SPACE_RE = re.compile(r"\s+")
+_MAPCLICK_HREF_RE = re.compile(r"""href\s*=\s*["']([^"']*MapClick\.php\?[^"']*)["']""", re.IGNORECASE)
 
 
-class EmailSettings(BaseModel):
-    sender: Optional[str] = Field(default=None, alias="MAIL_FROM")
-    recipient: Optional[str] = Field(default=None, alias="MAIL_TO")
-    host: Optional[str] = Field(default=None, alias="SMTP_HOST")
-    port: int = Field(default=587, alias="SMTP_PORT")
-    username: Optional[str] = Field(default=None, alias="SMTP_USER")
-    password: Optional[str] = Field(default=None, alias="SMTP_PASS")
-
-    model_config = {
-        "populate_by_name": True,
-    }
+@dataclass(slots=True)
+class EmailSettings:
+    sender: Optional[str] = None
+    recipient: Optional[str] = None
+    host: Optional[str] = None
+    port: int = 587
+    username: Optional[str] = None
+    password: Optional[str] = None
 
     @property
     def enabled(self) -> bool:
         return all([self.sender, self.recipient, self.host, self.username, self.password])
 
 
-class SiteSettings(BaseModel):
+@dataclass(slots=True)
+class SiteSettings:
     name: str
     latitude: float
     longitude: float
     address: Optional[str] = None
 
 
-class AppSettings(BaseModel):
-    days: int = Field(default=10)
-    primary_ingest: Literal["PUBLIC_FILES", "RSS"] = Field(default="PUBLIC_FILES")
-    rss_fallback: bool = Field(default=True)
-    cache_ttl_hours: int = Field(default=3)
-    user_agent: str = Field(default=DEFAULT_USER_AGENT)
-    tz: str = Field(default="America/New_York")
-    out_dir: Path = Field(default=Path("out"))
-    logs_dir: Path = Field(default=Path("logs"))
-    no_cache: bool = Field(default=False)
-    html_only: bool = Field(default=False)
+@dataclass(slots=True, kw_only=True)
+class AppSettings:
+    days: int = 10
+    primary_ingest: Literal["PUBLIC_FILES", "RSS"] = "PUBLIC_FILES"
+    rss_fallback: bool = True
+    cache_ttl_hours: int = 3
+    user_agent: str = DEFAULT_USER_AGENT
+    tz: str = "America/New_York"
+    out_dir: Path = Path("out")
+    logs_dir: Path = Path("logs")
+    no_cache: bool = False
+    html_only: bool = False
+    render_png: bool = False
     home: SiteSettings
     work: SiteSettings
     email: EmailSettings
+    _session: Optional[requests.Session] = field(default=None, repr=False, compare=False)
 
     @property
     def tzinfo(self):  # pragma: no cover - thin helper
         return ZoneInfo(self.tz)
 
+    @property
+    def session(self) -> requests.Session:
+        """Shared HTTP session so every client reuses pooled keep-alive connections."""
+        if self._session is None:
+            from .util.http import get_shared_session
+
+            self._session = get_shared_session(self.user_agent)
+        return self._session
 
-def _env_bool(key: str, default: bool = False) -> bool:
-    value = os.getenv(key)
+
+def _validate(settings: AppSettings) -> None:
+    if settings.primary_ingest not in {"PUBLIC_FILES", "RSS"}:
+        raise ValueError(f"primary_ingest must be PUBLIC_FILES or RSS, got {settings.primary_ingest!r}")
+    if settings.days < 1:
+        raise ValueError(f"days must be positive, got {settings.days}")
+    try:
+        ZoneInfo(settings.tz)
+    except (ValueError, ZoneInfoNotFoundError) as exc:
+        raise ValueError(f"unknown timezone {settings.tz!r}") from exc
+
+
+def _env_bool(env: Mapping[str, str], key: str, default: bool = False) -> bool:
+    value = env.get(key)
     if value is None:
         return default
     return value.lower() in {"1", "true", "yes", "on"}
 
 
-def _env_int(key: str, default: int) -> int:
-    value = os.getenv(key)
+def _env_int(env: Mapping[str, str], key: str, default: int) -> int:
+    value = env.get(key)
     if value is None:
         return default
     return int(value)
 
 
-def _env_float(key: str, default: float) -> float:
-    value = os.getenv(key)
+def _env_float(env: Mapping[str, str], key: str, default: float) -> float:
+    value = env.get(key)
     if value is None or value.strip() == "":
         return default
     return float(value)
 
 
-def _cli_or_env_float(cli_value: Any | None, env_key: str, default: float) -> float:
+def _cli_or_env_float(env: Mapping[str, str], cli_value: Any | None, env_key: str, default: float) -> float:
     if cli_value is not None:
         return float(cli_value)
-    return _env_float(env_key, default)
+    return _env_float(env, env_key, default)
+
 
+def _normalize_addr(address: str) -> str:
+    stripped = _ADDR_PUNCT_RE.sub(" ", address.lower())
+    return _ADDR_SPACE_RE.sub(" ", stripped).strip()
 
-def _maybe_read_cached_coords(path: Path) -> Optional[tuple[float, float]]:
+
+def _load_geocode_cache(path: Path) -> dict[str, dict[str, float]]:
     if not path.exists():
-        return None
+        return {}
     try:
         payload = json.loads(path.read_text())
-        return float(payload["lat"]), float(payload["lon"])
     except Exception:
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def _maybe_read_cached_coords(path: Path, address: str) -> Optional[tuple[float, float]]:
+    entry = _load_geocode_cache(path).get(_normalize_addr(address))
+    if not entry:
+        return None
+    try:
+        return float(entry["lat"]), float(entry["lon"])
+    except (KeyError, TypeError, ValueError):
         return None
 
 
-def _write_cached_coords(path: Path, lat: float, lon: float) -> None:
+def _write_cached_coords(path: Path, address: str, lat: float, lon: float) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps({"lat": lat, "lon": lon}, indent=2))
+    cache = _load_geocode_cache(path)
+    cache[_normalize_addr(address)] = {"lat": lat, "lon": lon, "ts": time.time()}
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as fh:
+            json.dump(cache, fh, indent=2)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
 
 
 def _resolve_work_coords(address: str, out_dir: Path, session: requests.Session) -> tuple[float, float]:
-    cache_path = out_dir / "work_coords.json"
-    cached = _maybe_read_cached_coords(cache_path)
+    cache_path = out_dir / GEOCODE_CACHE_NAME
+    cached = _maybe_read_cached_coords(cache_path, address)
     if cached:
         return cached
 
     resp = session.get(ZIPCITY_URL, params={"inputstring": address}, timeout=30)
     resp.raise_for_status()
-    soup = BeautifulSoup(resp.text, "html.parser")
-    for anchor in soup.find_all("a"):
-        href = anchor.get("href", "")
-        if "MapClick.php" in href and "lat=" in href and "lon=" in href:
+    for match in _MAPCLICK_HREF_RE.finditer(resp.text):
+        href = html.unescape(match.group(1))
+        if "lat=" in href and "lon=" in href:
             parsed = urlparse(href)
             qs = parse_qs(parsed.query)
             try:
@@ -123,70 +174,79 @@ def _resolve_work_coords(address: str, out_dir: Path, session: requests.Session)
                 lon = float(qs.get("lon", [None])[0])
             except (TypeError, ValueError):
                 continue
-            _write_cached_coords(cache_path, lat, lon)
+            _write_cached_coords(cache_path, address, lat, lon)
             return lat, lon
     raise RuntimeError("Unable to resolve work coordinates from NWS zipcity search")
 
 
 def load_settings(cli_args: dict[str, Any] | None = None) -> AppSettings:
+    from dotenv import load_dotenv
+
     load_dotenv()
     cli_args = cli_args or {}
+    # One snapshot after dotenv has populated os.environ; every lookup below reads from it.
+    env = dict(os.environ)
 
-    out_dir = Path(cli_args.get("out_dir") or os.getenv("OUT_DIR", "out")).expanduser()
-    logs_dir = Path(cli_args.get("logs_dir") or os.getenv("LOGS_DIR", "logs")).expanduser()
+    out_dir = Path(cli_args.get("out_dir") or env.get("OUT_DIR", "out")).expanduser()
+    logs_dir = Path(cli_args.get("logs_dir") or env.get("LOGS_DIR", "logs")).expanduser()
 
-    session = requests.Session()
-    session.headers.update({"User-Agent": os.getenv("USER_AGENT", DEFAULT_USER_AGENT)})
+    user_agent = cli_args.get("user_agent") or env.get("USER_AGENT", DEFAULT_USER_AGENT)
+    session: Optional[requests.Session] = None
 
     home = SiteSettings(
-        name=cli_args.get("place_home") or os.getenv("PLACE_HOME", "Home"),
-        latitude=_cli_or_env_float(cli_args.get("home_lat"), "HOME_LAT", 39.3381),
-        longitude=_cli_or_env_float(cli_args.get("home_lon"), "HOME_LON", -77.7925),
+        name=cli_args.get("place_home") or env.get("PLACE_HOME", "Home"),
+        latitude=_cli_or_env_float(env, cli_args.get("home_lat"), "HOME_LAT", 39.3381),
+        longitude=_cli_or_env_float(env, cli_args.get("home_lon"), "HOME_LON", -77.7925),
     )
 
-    work_lat = cli_args.get("work_lat") or os.getenv("WORK_LAT")
-    work_lon = cli_args.get("work_lon") or os.getenv("WORK_LON")
-    work_address = cli_args.get("work_address") or os.getenv("WORK_ADDRESS", "1042 Development Drive, Inwood, WV")
+    work_lat = cli_args.get("work_lat") or env.get("WORK_LAT")
+    work_lon = cli_args.get("work_lon") or env.get("WORK_LON")
+    work_address = cli_args.get("work_address") or env.get("WORK_ADDRESS", "1042 Development Drive, Inwood, WV")
 
     if work_lat and work_lon:
+        # Explicit overrides are used as-is and never cached, so the address's geocode stays its own
         lat, lon = float(work_lat), float(work_lon)
-        _write_cached_coords(out_dir / "work_coords.json", lat, lon)
     else:
+        from .util.http import get_shared_session
+
+        session = get_shared_session(user_agent)
         lat, lon = _resolve_work_coords(work_address, out_dir, session)
 
     work = SiteSettings(
-        name=cli_args.get("place_work") or os.getenv("PLACE_WORK", work_address),
+        name=cli_args.get("place_work") or env.get("PLACE_WORK", work_address),
         latitude=lat,
         longitude=lon,
         address=work_address,
     )
 
     data: dict[str, Any] = {
-        "days": int(cli_args.get("days") or os.getenv("DAYS", 10)),
-        "primary_ingest": (cli_args.get("primary") or os.getenv("PRIMARY_INGEST", "PUBLIC_FILES")).upper(),
-        "rss_fallback": cli_args.get("rss_fallback") if cli_args.get("rss_fallback") is not None else _env_bool("RSS_FALLBACK", True),
-        "cache_ttl_hours": int(cli_args.get("cache_ttl_hours") or os.getenv("CACHE_TTL_HOURS", 3)),
-        "user_agent": cli_args.get("user_agent") or os.getenv("USER_AGENT", DEFAULT_USER_AGENT),
-        "tz": cli_args.get("tz") or os.getenv("TZ", "America/New_York"),
+        "days": int(cli_args.get("days") or env.get("DAYS", 10)),
+        "primary_ingest": (cli_args.get("primary") or env.get("PRIMARY_INGEST", "PUBLIC_FILES")).upper(),
+        "rss_fallback": cli_args.get("rss_fallback") if cli_args.get("rss_fallback") is not None else _env_bool(env, "RSS_FALLBACK", True),
+        "cache_ttl_hours": int(cli_args.get("cache_ttl_hours") or env.get("CACHE_TTL_HOURS", 3)),
+        "user_agent": user_agent,
+        "tz": cli_args.get("tz") or env.get("TZ", "America/New_York"),
         "out_dir": out_dir,
         "logs_dir": logs_dir,
         "no_cache": bool(cli_args.get("no_cache")),
         "html_only": bool(cli_args.get("html_only")),
+        "render_png": cli_args.get("png") if cli_args.get("png") is not None else _env_bool(env, "RENDER_PNG", False),
         "home": home,
         "work": work,
         "email": EmailSettings(
-            MAIL_FROM=os.getenv("MAIL_FROM"),
-            MAIL_TO=os.getenv("MAIL_TO"),
-            SMTP_HOST=os.getenv("SMTP_HOST"),
-            SMTP_PORT=int(os.getenv("SMTP_PORT", 587)),
-            SMTP_USER=os.getenv("SMTP_USER"),
-            SMTP_PASS=os.getenv("SMTP_PASS"),
+            sender=env.get("MAIL_FROM"),
+            recipient=env.get("MAIL_TO"),
+            host=env.get("SMTP_HOST"),
+            port=int(env.get("SMTP_PORT", 587)),
+            username=env.get("SMTP_USER"),
+            password=env.get("SMTP_PASS"),
         ),
     }
 
+    settings = AppSettings(**data, _session=session)
     try:
-        settings = AppSettings(**data)
-    except ValidationError as exc:  # pragma: no cover - startup guard
+        _validate(settings)
+    except ValueError as exc:  # pragma: no cover - startup guard
         raise RuntimeError(f"Invalid configuration: {exc}")
 
     settings.out_dir.mkdir(parents=True, exist_ok=True)
@@ -1,9 +1,26 @@
 from __future__ import annotations
 
+import hashlib
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import Callable, Protocol
+from typing import Any, BinaryIO, Callable, Dict, Optional, Protocol
+
+import orjson
+
+MEMO_MAX_ENTRIES = 64
+MEMO_MAX_BYTES = 64 * 1024 * 1024
+# Larger payloads (GRIB slices, big JSON) are re-read from disk rather than crowding out everything else
+MEMO_MAX_ITEM_BYTES = 4 * 1024 * 1024
+PARSED_NAMESPACE = "parsed"
+# Part of every parsed/ key; bump it whenever a cached result type changes shape
+PARSED_FORMAT_VERSION = 1
 
 
 class Downloader(Protocol):
@@ -11,6 +28,70 @@ class Downloader(Protocol):
         ...
 
 
+class StreamWriter(Protocol):
+    def __call__(self, fh: BinaryIO) -> None:  # pragma: no cover - structural contract
+        ...
+
+
+def _copy_body(resp) -> StreamWriter:
+    """Writer that copies a ``stream=True`` response body into ``fh`` and then releases the connection."""
+
+    def _write(fh: BinaryIO) -> None:
+        with resp:
+            resp.raw.decode_content = True
+            shutil.copyfileobj(resp.raw, fh)
+
+    return _write
+
+
+@dataclass
+class DownloadResult:
+    """Payload plus validators from a conditional GET; ``content`` and ``writer`` are both None on 304 Not Modified."""
+
+    content: Optional[bytes]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    writer: Optional[StreamWriter] = None
+
+    @property
+    def not_modified(self) -> bool:
+        return self.content is None and self.writer is None
+
+    @classmethod
+    def from_response(cls, resp) -> "DownloadResult":
+        if resp.status_code == 304:
+            return cls(content=None)
+        resp.raise_for_status()
+        return cls(
+            content=resp.content,
+            etag=resp.headers.get("ETag"),
+            last_modified=resp.headers.get("Last-Modified"),
+        )
+
+    @classmethod
+    def from_stream(cls, resp) -> "DownloadResult":
+        """Like ``from_response`` for a ``stream=True`` request; the body is copied to disk, never buffered."""
+        if resp.status_code == 304:
+            resp.close()
+            return cls(content=None)
+        try:
+            resp.raise_for_status()
+        except Exception:
+            resp.close()
+            raise
+        return cls(
+            content=None,
+            etag=resp.headers.get("ETag"),
+            last_modified=resp.headers.get("Last-Modified"),
+            writer=_copy_body(resp),
+        )
+
+
+class ConditionalDownloader(Protocol):
+    def __call__(self, headers: Dict[str, str]) -> DownloadResult:  # pragma: no cover - structural contract
+        ...
+
+
 @dataclass
 class CachedFile:
     path: Path
@@ -24,32 +105,195 @@ class CacheManager:
         self.root = root
         self.ttl = timedelta(hours=max(ttl_hours, 0))
         self.root.mkdir(parents=True, exist_ok=True)
+        self._created_dirs: set[Path] = {self.root}
+        self._memo: OrderedDict[tuple[str, str, str, int], str | bytes] = OrderedDict()
+        self._memo_bytes = 0
+        self._memo_lock = threading.Lock()
 
     def _is_fresh(self, path: Path) -> bool:
-        if not path.exists():
-            return False
         if self.ttl == timedelta(0):
             return False
-        mtime = datetime.fromtimestamp(path.stat().st_mtime, tz=UTC)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return False
+        mtime = datetime.fromtimestamp(st.st_mtime, tz=UTC)
         return datetime.now(UTC) - mtime <= self.ttl
 
     def _slot(self, namespace: str, name: str) -> Path:
         slot = self.root / namespace / name
-        slot.parent.mkdir(parents=True, exist_ok=True)
+        if slot.parent not in self._created_dirs:
+            slot.parent.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(slot.parent)
         return slot
 
+    @staticmethod
+    def _write_atomic_with(target: Path, writer: StreamWriter) -> None:
+        # Concurrent fetchers may race on the same slot; readers must never see a partial file.
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                writer(fh)
+            os.replace(tmp_name, target)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    @classmethod
+    def _write_atomic(cls, target: Path, data: bytes) -> None:
+        cls._write_atomic_with(target, lambda fh: fh.write(data))
+
     def fetch(self, namespace: str, name: str, downloader: Downloader) -> CachedFile:
         target = self._slot(namespace, name)
         if self._is_fresh(target):
             return CachedFile(path=target, fresh=True)
         data = downloader()
-        target.write_bytes(data)
+        self._write_atomic(target, data)
+        return CachedFile(path=target, fresh=False)
+
+    @staticmethod
+    def _meta_path(target: Path) -> Path:
+        return target.with_name(f"{target.name}.meta.json")
+
+    def discard(self, namespace: str, name: str) -> None:
+        """Delete an entry and its validators, e.g. a scratch part that has been consumed."""
+        target = self.root / namespace / name
+        target.unlink(missing_ok=True)
+        self.drop_validators(target)
+
+    def drop_validators(self, target: Path) -> None:
+        """Forget the ETag/Last-Modified of an entry whose content was replaced out of band."""
+        self._meta_path(target).unlink(missing_ok=True)
+
+    def _validators(self, target: Path) -> Dict[str, str]:
+        # --no-cache (zero TTL) always re-downloads in full.
+        if self.ttl == timedelta(0) or not target.exists():
+            return {}
+        try:
+            meta = orjson.loads(self._meta_path(target).read_bytes())
+        except (OSError, ValueError):
+            return {}
+        headers: Dict[str, str] = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def fetch_conditional(self, namespace: str, name: str, downloader: ConditionalDownloader) -> CachedFile:
+        """Like ``fetch`` but revalidates stale entries with If-None-Match/If-Modified-Since."""
+        target = self._slot(namespace, name)
+        if self._is_fresh(target):
+            return CachedFile(path=target, fresh=True)
+        headers = self._validators(target)
+        result = downloader(headers)
+        if result.not_modified:
+            if not headers:
+                raise RuntimeError(f"Unexpected 304 for uncached {namespace}/{name}")
+            os.utime(target, None)
+            return CachedFile(path=target, fresh=True)
+        if result.writer is not None:
+            self._write_atomic_with(target, result.writer)
+        else:
+            self._write_atomic(target, result.content)
+        meta_path = self._meta_path(target)
+        if result.etag or result.last_modified:
+            meta_path.write_bytes(orjson.dumps({"etag": result.etag, "last_modified": result.last_modified}))
+        else:
+            meta_path.unlink(missing_ok=True)
         return CachedFile(path=target, fresh=False)
 
-    def read_text(self, namespace: str, name: str, downloader: Downloader) -> str:
-        cached = self.fetch(namespace, name, downloader)
-        return cached.path.read_text()
+    def _remember(self, key: tuple, data: str | bytes) -> None:
+        size = len(data)
+        if size > MEMO_MAX_ITEM_BYTES:
+            return
+        with self._memo_lock:
+            previous = self._memo.pop(key, None)
+            if previous is not None:
+                self._memo_bytes -= len(previous)
+            self._memo[key] = data
+            self._memo_bytes += size
+            while len(self._memo) > MEMO_MAX_ENTRIES or self._memo_bytes > MEMO_MAX_BYTES:
+                _key, evicted = self._memo.popitem(last=False)
+                self._memo_bytes -= len(evicted)
 
-    def read_bytes(self, namespace: str, name: str, downloader: Downloader) -> bytes:
-        cached = self.fetch(namespace, name, downloader)
-        return cached.path.read_bytes()
+    def _memoized(self, kind: str, namespace: str, name: str, path: Path, loader: Callable[[Path], str | bytes]):
+        # Keyed on mtime so a re-download or in-place rewrite invalidates the entry.
+        key = (kind, namespace, name, os.stat(path).st_mtime_ns)
+        with self._memo_lock:
+            if key in self._memo:
+                self._memo.move_to_end(key)
+                return self._memo[key]
+        data = loader(path)
+        self._remember(key, data)
+        return data
+
+    def store(self, namespace: str, name: str, data: bytes) -> CachedFile:
+        """Replace an entry with bytes already in hand; later ``read_bytes`` calls reuse them instead of re-reading."""
+        target = self._slot(namespace, name)
+        self._write_atomic(target, data)
+        self._remember(("bytes", namespace, name, os.stat(target).st_mtime_ns), data)
+        return CachedFile(path=target, fresh=False)
+
+    def read_text(self, namespace: str, name: str, downloader: Downloader | ConditionalDownloader, conditional: bool = False) -> str:
+        if conditional:
+            cached = self.fetch_conditional(namespace, name, downloader)
+        else:
+            cached = self.fetch(namespace, name, downloader)
+        return self._memoized("text", namespace, name, cached.path, Path.read_text)
+
+    def read_bytes(self, namespace: str, name: str, downloader: Downloader | ConditionalDownloader, conditional: bool = False) -> bytes:
+        if conditional:
+            cached = self.fetch_conditional(namespace, name, downloader)
+        else:
+            cached = self.fetch(namespace, name, downloader)
+        return self._memoized("bytes", namespace, name, cached.path, Path.read_bytes)
+
+    def prune_stale(self, namespace: str) -> None:
+        """Delete expired entries; content-addressed namespaces never overwrite a slot, so they must be swept."""
+        folder = self.root / namespace
+        if not folder.is_dir():
+            return
+        for path in folder.iterdir():
+            if not self._is_fresh(path):
+                path.unlink(missing_ok=True)
+
+    def parsed(self, source: bytes | Path, key: tuple, parse: Callable[[], Any]) -> Any:
+        """``parse()`` memoized on the blake2b of ``source`` (payload bytes or a cached file) plus ``key``.
+
+        Results are kept pickled, in memory and under ``parsed/`` for the TTL, so a warm run with unchanged
+        content skips parsing and every caller still gets objects of its own. Entries are unpickled as-is, so the
+        cache root must be trusted: only this process writes it, and nothing under it is shared or downloaded.
+        Expired entries are left for the caller to sweep once per run with ``prune_stale(PARSED_NAMESPACE)``.
+        """
+        if self.ttl == timedelta(0):
+            return parse()
+        if isinstance(source, Path):
+            with source.open("rb") as fh:
+                hasher = hashlib.file_digest(fh, lambda: hashlib.blake2b(digest_size=16))
+        else:
+            hasher = hashlib.blake2b(source, digest_size=16)
+        hasher.update(repr((PARSED_FORMAT_VERSION, key)).encode())
+        name = f"{hasher.hexdigest()}.pkl"
+        memo_key = ("pickle", PARSED_NAMESPACE, name, 0)
+        with self._memo_lock:
+            blob = self._memo.get(memo_key)
+            if blob is not None:
+                self._memo.move_to_end(memo_key)
+        if blob is not None:
+            return pickle.loads(blob)
+        target = self._slot(PARSED_NAMESPACE, name)
+        if self._is_fresh(target):
+            blob = target.read_bytes()
+            try:
+                result = pickle.loads(blob)
+            except Exception:  # truncated entry or one written by an older model layout
+                pass
+            else:
+                self._remember(memo_key, blob)
+                return result
+        blob = pickle.dumps(parse(), protocol=pickle.HIGHEST_PROTOCOL)
+        self._write_atomic(target, blob)
+        self._remember(memo_key, blob)
+        # Unpickled rather than handed back directly, so later hits never share these objects
+        return pickle.loads(blob)
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import heapq
+import re
+import sys
 from collections import defaultdict
-from datetime import date
-from typing import Dict, Iterable, List, Tuple
-from xml.etree import ElementTree as ET
+from datetime import date, datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
 
-from dateutil import parser as dtparser
+from lxml import etree
 
 from ..config import SiteSettings
 from ..models import SourceDailyRecord
@@ -21,150 +25,181 @@ PRECIP_PRIORITY = [
     "Drizzle",
     "Thunderstorms",
 ]
+_PRECIP_RANK = {name: rank for rank, name in enumerate(PRECIP_PRIORITY)}
+_WIND_RE = re.compile(r"breezy|wind|gust", re.IGNORECASE)
+# Text payloads are fed to the pull parser in slices of this many characters
+FEED_CHUNK_CHARS = 64 * 1024
 
+# DWML amount units -> inches; unknown units pass through unscaled
+_UNIT_FACTORS = {
+    "inches": 1.0,
+    "inch": 1.0,
+    "in": 1.0,
+    "mm": 0.0393701,
+    "millimeters": 0.0393701,
+    "kg/m^2": 0.0393701,
+    "kg/m2": 0.0393701,
+    "m": 39.3701,
+}
+
+
+def _add_qpf(record: SourceDailyRecord, amount: float) -> None:
+    record.qpf_inches = round((record.qpf_inches or 0) + amount, 2)
+
+
+def _add_snow(record: SourceDailyRecord, amount: float) -> None:
+    record.snow_inches = round((record.snow_inches or 0) + amount, 2)
+
+
+def _add_ice(record: SourceDailyRecord, amount: float) -> None:
+    record.ice_inches = round((record.ice_inches or 0) + amount, 2)
+
+
+# (tag, precipitation type) -> accumulator for that amount
+AMOUNT_ACCUMULATORS = {
+    ("precipitation", "liquid"): _add_qpf,
+    ("precipitation", "snow"): _add_snow,
+    ("precipitation", "ice"): _add_ice,
+    ("snow-amount", ""): _add_snow,
+    ("ice-accumulation", ""): _add_ice,
+}
+
+
+# Compiled once; plain (non-"smart") strings so results do not pin the tree being cleared during iterparse
+_XP_LAYOUT_KEY = etree.XPath("string(layout-key)")
+_XP_START_TIMES = etree.XPath("start-valid-time/text()", smart_strings=False)
 
-def _parse_time_layouts(root: ET.Element, tzinfo) -> Dict[str, List]:
-    layouts: Dict[str, List] = {}
-    for layout in root.findall(".//time-layout"):
-        key = layout.findtext("layout-key")
-        if not key:
-            continue
-        times: List = []
-        for node in layout.findall("start-valid-time"):
-            try:
-                dt = dtparser.isoparse(node.text)
-            except (TypeError, ValueError):
-                continue
-            times.append(dt.astimezone(tzinfo))
-        layouts[key] = times
-    return layouts
+
+@lru_cache(maxsize=4096)
+def _local_date(text: str, tzinfo) -> date | None:
+    # Layouts repeat the same start times across elements, sources and sites; convert each string once.
+    try:
+        dt = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    return dt.astimezone(tzinfo).date()
+
+
+def _parse_layout_dates(layout: etree._Element, tzinfo) -> List[date]:
+    dates: List[date] = []
+    for text in _XP_START_TIMES(layout):
+        day = _local_date(text, tzinfo)
+        if day is not None:
+            dates.append(day)
+    return dates
 
 
 def _ensure_record(bucket: Dict[date, SourceDailyRecord], site: SiteSettings, day: date, source: str) -> SourceDailyRecord:
     if day not in bucket:
         bucket[day] = SourceDailyRecord(
-            site_name=site.name,
+            site_name=sys.intern(site.name),
             date=day,
             label=format_day_label(day),
-            source=source,
+            source=sys.intern(source),
         )
     return bucket[day]
 
 
 def _summarize_precip(types: Iterable[str]) -> Tuple[str | None, str]:
-    seen = list(dict.fromkeys([t for t in types if t]))
+    seen = list(dict.fromkeys(t for t in types if t))
     if not seen:
         return None, ""
-    for preferred in PRECIP_PRIORITY:
-        if preferred in seen:
-            primary = preferred
-            break
-    else:
-        primary = seen[0]
+    # Unranked types tie at the bottom, so min() falls back to the first one seen.
+    primary = min(seen, key=lambda t: _PRECIP_RANK.get(t, len(PRECIP_PRIORITY)))
     notes = ", ".join(seen)
     return primary, notes
 
 
-def _convert_amount(value: str | None, units: str | None) -> float | None:
-    if value is None or value.strip() == "":
+def _to_float(value: str | None) -> float | None:
+    # Blank/nil values are common in DWML; screen them before paying for exception handling.
+    if value is None or not value.strip():
         return None
     try:
-        numeric = float(value)
+        return float(value)
     except ValueError:
         return None
-    units = (units or "").lower()
-    if units in {"inches", "inch", "in"}:
-        return round(numeric, 2)
-    if units in {"mm", "millimeters"}:
-        return round(numeric * 0.0393701, 2)
-    if units in {"kg/m^2", "kg/m2"}:
-        return round(numeric * 0.0393701, 2)
-    if units in {"m"}:
-        return round(numeric * 39.3701, 2)
-    return round(numeric, 2)
-
-
-def parse_dwml(xml_text: str, site: SiteSettings, days: int, tzinfo, source_name: str = "nws_rss") -> List[SourceDailyRecord]:
-    root = ET.fromstring(xml_text)
-    layouts = _parse_time_layouts(root, tzinfo)
-    daily: Dict[date, SourceDailyRecord] = {}
-
-    for temp_node in root.findall(".//temperature"):
-        temp_type = temp_node.get("type")
-        layout_key = temp_node.get("time-layout")
-        if not layout_key or layout_key not in layouts:
-            continue
-        times = layouts[layout_key]
-        values = [node.text for node in temp_node.findall("value")]
-        for ts, val in zip(times, values, strict=False):
-            day = ts.date()
-            record = _ensure_record(daily, site, day, source_name)
-            try:
-                num = float(val)
-            except (TypeError, ValueError):
+
+
+def _convert_amount(value: str | None, units: str | None) -> float | None:
+    numeric = _to_float(value)
+    if numeric is None:
+        return None
+    return round(numeric * _UNIT_FACTORS.get((units or "").lower(), 1.0), 2)
+
+
+class _DwmlBuilder:
+    """Accumulates daily records while the DWML document is streamed."""
+
+    __slots__ = ("site", "source_name", "tzinfo", "layouts", "layout_records", "daily", "weather_notes", "weather_types")
+
+    def __init__(self, site: SiteSettings, source_name: str, tzinfo) -> None:
+        self.site = site
+        self.source_name = source_name
+        self.tzinfo = tzinfo
+        self.layouts: Dict[str, List[date]] = {}
+        self.layout_records: Dict[str, List[SourceDailyRecord]] = {}
+        self.daily: Dict[date, SourceDailyRecord] = {}
+        self.weather_notes: Dict[date, List[str]] = defaultdict(list)
+        self.weather_types: Dict[date, List[str]] = defaultdict(list)
+
+    def iter_records(self, layout_key: str) -> Iterator[SourceDailyRecord]:
+        """Records aligned with a layout's periods, materialized on first use and shared by every parameter.
+
+        Zip values *before* this iterator so a record is only created for a period that carries a value.
+        """
+        records = self.layout_records.setdefault(layout_key, [])
+        for idx, day in enumerate(self.layouts[layout_key]):
+            if idx == len(records):
+                records.append(_ensure_record(self.daily, self.site, day, self.source_name))
+            yield records[idx]
+
+    def add_layout(self, node: etree._Element) -> None:
+        key = _XP_LAYOUT_KEY(node)
+        if key:
+            self.layouts[key] = _parse_layout_dates(node, self.tzinfo)
+            self.layout_records.pop(key, None)
+
+    def handle_temperature(self, node: etree._Element, layout_key: str) -> None:
+        temp_type = node.get("type")
+        values = (child.text for child in node.iterchildren("value"))
+        for val, record in zip(values, self.iter_records(layout_key)):
+            num = _to_float(val)
+            if num is None:
                 continue
             if temp_type == "maximum":
                 record.high_f = num
             elif temp_type == "minimum":
                 record.low_f = num
 
-    for pop_node in root.findall(".//probability-of-precipitation"):
-        layout_key = pop_node.get("time-layout")
-        if not layout_key or layout_key not in layouts:
-            continue
-        times = layouts[layout_key]
-        values = [node.text for node in pop_node.findall("value")]
-        for ts, val in zip(times, values, strict=False):
-            day = ts.date()
-            record = _ensure_record(daily, site, day, source_name)
-            try:
-                num = float(val) if val not in (None, "") else None
-            except ValueError:
-                num = None
+    def handle_pop(self, node: etree._Element, layout_key: str) -> None:
+        values = (child.text for child in node.iterchildren("value"))
+        for val, record in zip(values, self.iter_records(layout_key)):
+            num = _to_float(val)
             if num is None:
                 continue
             record.pop_pct = max(record.pop_pct or 0, num)
 
-    def _accumulate_amount(tag: str, attr_type: str, field: str):
-        for node in root.findall(f".//{tag}"):
-            node_type = (node.get("type") or "").lower()
-            if attr_type and node_type != attr_type:
+    def handle_amount(self, node: etree._Element, layout_key: str) -> None:
+        node_type = (node.get("type") or "").lower() if node.tag == "precipitation" else ""
+        accumulate = AMOUNT_ACCUMULATORS.get((node.tag, node_type))
+        if accumulate is None:
+            return
+        units = node.get("units")
+        convert = _convert_amount
+        values = (child.text for child in node.iterchildren("value"))
+        for val, record in zip(values, self.iter_records(layout_key)):
+            amount = convert(val, units)
+            if amount is None or amount <= 0:
                 continue
-            layout_key = node.get("time-layout")
-            if not layout_key or layout_key not in layouts:
-                continue
-            units = node.get("units")
-            values = [child.text for child in node.findall("value")]
-            for ts, val in zip(layouts[layout_key], values, strict=False):
-                day = ts.date()
-                record = _ensure_record(daily, site, day, source_name)
-                amount = _convert_amount(val, units)
-                if amount is None or amount <= 0:
-                    continue
-                current = getattr(record, field)
-                setattr(record, field, round((current or 0) + amount, 2))
-
-    _accumulate_amount("precipitation", "liquid", "qpf_inches")
-    _accumulate_amount("precipitation", "snow", "snow_inches")
-    _accumulate_amount("precipitation", "ice", "ice_inches")
-    _accumulate_amount("snow-amount", "", "snow_inches")
-    _accumulate_amount("ice-accumulation", "", "ice_inches")
-
-    weather_notes: Dict[date, List[str]] = defaultdict(list)
-    weather_types: Dict[date, List[str]] = defaultdict(list)
-    for weather_node in root.findall(".//weather"):
-        layout_key = weather_node.get("time-layout")
-        if not layout_key or layout_key not in layouts:
-            continue
-        times = layouts[layout_key]
-        value_nodes = weather_node.findall("value")
-        for ts, value_node in zip(times, value_nodes, strict=False):
-            day = ts.date()
-            record = _ensure_record(daily, site, day, source_name)
+            accumulate(record, amount)
+
+    def handle_weather(self, node: etree._Element, layout_key: str) -> None:
+        for value_node, record in zip(node.iterchildren("value"), self.iter_records(layout_key)):
+            day = record.date
             summary = value_node.get("weather-summary")
             if summary:
-                weather_notes[day].append(summary)
-            for condition in value_node.findall("weather-conditions"):
+                self.weather_notes[day].append(summary)
+            for condition in value_node.iterchildren("weather-conditions"):
                 wtype = condition.get("weather-type")
                 if not wtype or wtype == "none":
                     continue
@@ -176,17 +211,11 @@ def parse_dwml(xml_text: str, site: SiteSettings, days: int, tzinfo, source_name
                     descriptor = f"{intensity.title()} {descriptor}"
                 if coverage and coverage not in {"definite"}:
                     descriptor = f"{coverage.title()} {descriptor}"
-                weather_types[day].append(descriptor)
-
-    for wf_node in root.findall(".//wordedForecast"):
-        layout_key = wf_node.get("time-layout")
-        if not layout_key or layout_key not in layouts:
-            continue
-        times = layouts[layout_key]
-        texts = [node.text or "" for node in wf_node.findall("text")]
-        for ts, text in zip(times, texts, strict=False):
-            day = ts.date()
-            record = _ensure_record(daily, site, day, source_name)
+                self.weather_types[day].append(descriptor)
+
+    def handle_worded(self, node: etree._Element, layout_key: str) -> None:
+        texts = (child.text or "" for child in node.iterchildren("text"))
+        for text, record in zip(texts, self.iter_records(layout_key)):
             normalized = text.strip()
             if not normalized:
                 continue
@@ -194,19 +223,64 @@ def parse_dwml(xml_text: str, site: SiteSettings, days: int, tzinfo, source_name
                 record.notes += " | " + normalized
             else:
                 record.notes = normalized
-            lowered = normalized.lower()
-            if any(token in lowered for token in ("breezy", "wind", "gust")):
+            if _WIND_RE.search(normalized):
                 record.wind_phrase = normalized
 
-    for day, record in daily.items():
-        ptype, notes = _summarize_precip(weather_types.get(day, []))
-        if ptype:
-            record.precip_type = ptype
-        if notes or weather_notes.get(day):
-            fragments = weather_notes.get(day, [])
-            if notes:
-                fragments.insert(0, notes)
-            record.precip_notes = "; ".join(dict.fromkeys(filter(None, fragments)))
-
-    ordered_days = sorted(daily.keys())[:days]
-    return [daily[d] for d in ordered_days]
+    def finish(self, days: int) -> List[SourceDailyRecord]:
+        for day, record in self.daily.items():
+            ptype, notes = _summarize_precip(self.weather_types.get(day, []))
+            if ptype:
+                record.precip_type = ptype
+            if notes or self.weather_notes.get(day):
+                fragments = self.weather_notes.get(day, [])
+                if notes:
+                    fragments.insert(0, notes)
+                record.precip_notes = "; ".join(dict.fromkeys(filter(None, fragments)))
+
+        ordered_days = heapq.nsmallest(days, self.daily)
+        return [self.daily[d] for d in ordered_days]
+
+
+_HANDLERS = {
+    "temperature": _DwmlBuilder.handle_temperature,
+    "probability-of-precipitation": _DwmlBuilder.handle_pop,
+    "precipitation": _DwmlBuilder.handle_amount,
+    "snow-amount": _DwmlBuilder.handle_amount,
+    "ice-accumulation": _DwmlBuilder.handle_amount,
+    "weather": _DwmlBuilder.handle_weather,
+    "wordedForecast": _DwmlBuilder.handle_worded,
+}
+DWML_TAGS = ("time-layout", *_HANDLERS)
+
+
+def _consume(builder: _DwmlBuilder, events: Iterable[Tuple[str, etree._Element]]) -> None:
+    # DWML declares every time-layout ahead of the parameters that reference it, so one pass suffices.
+    for _event, elem in events:
+        if elem.tag == "time-layout":
+            builder.add_layout(elem)
+        else:
+            layout_key = elem.get("time-layout")
+            if layout_key and layout_key in builder.layouts:
+                _HANDLERS[elem.tag](builder, elem, layout_key)
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+
+def parse_dwml(xml_text: str | bytes, site: SiteSettings, days: int, tzinfo, source_name: str = "nws_rss") -> List[SourceDailyRecord]:
+    """Stream an in-memory DWML document; slices are fed as-is, so no encoded copy of the whole text is made."""
+    builder = _DwmlBuilder(site, source_name, tzinfo)
+    parser = etree.XMLPullParser(events=("end",), tag=DWML_TAGS)
+    for start in range(0, len(xml_text), FEED_CHUNK_CHARS):
+        parser.feed(xml_text[start : start + FEED_CHUNK_CHARS])
+        _consume(builder, parser.read_events())
+    parser.close()
+    _consume(builder, parser.read_events())
+    return builder.finish(days)
+
+
+def parse_dwml_path(path: Path, site: SiteSettings, days: int, tzinfo, source_name: str = "nws_rss") -> List[SourceDailyRecord]:
+    """Stream a DWML file straight from disk, honouring its declared encoding."""
+    builder = _DwmlBuilder(site, source_name, tzinfo)
+    _consume(builder, etree.iterparse(str(path), events=("end",), tag=DWML_TAGS))
+    return builder.finish(days)
@@ -1,20 +1,34 @@
 from __future__ import annotations
 
+import hashlib
 import logging
+import re
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, date, datetime, timedelta
+from io import BytesIO
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Tuple
 
+import numpy as np
+
 try:  # pragma: no cover - optional heavy dependency
     import xarray as xr
 except ImportError:  # pragma: no cover
     xr = None
 
+try:  # pragma: no cover - optional heavy dependency
+    import eccodes
+except (ImportError, RuntimeError):  # pragma: no cover - missing Python bindings or libeccodes
+    eccodes = None
+
 from ..config import SiteSettings
 from ..models import SourceDailyRecord
 from ..util.time import format_day_label
-from .cache import CacheManager
+from .cache import CacheManager, DownloadResult
 
 LOGGER = logging.getLogger(__name__)
 BASE_URL = "https://noaa-nbm-grib2-pds.s3.amazonaws.com"
@@ -22,6 +36,20 @@ DOMAIN = "co"
 FIELD_WINDOW_HOURS = 12
 TMP_SAMPLE_STEP = 3
 MM_TO_INCH = 0.0393701
+DOWNLOAD_WORKERS = 12
+# Messages larger than this are fetched as parallel RANGE_CHUNK_BYTES sub-ranges (S3 sweet spot is 8-16 MB)
+RANGE_SPLIT_THRESHOLD = 16 * 1024 * 1024
+RANGE_CHUNK_BYTES = 8 * 1024 * 1024
+RANGE_WORKERS = 4
+# Requested messages separated by less than this many bytes share one ranged GET
+BUNDLE_MAX_GAP_BYTES = 4 * 1024 * 1024
+# "<message number>:<byte offset>:<wgrib2 description>" per line of a .idx file
+_INDEX_LINE_RE = re.compile(r"^(\d+):(\d+)(?::([^\r\n]*))?\r?$", re.MULTILINE)
+# Decoded grids kept in memory (LRU); one forecast day touches about 8 fields
+FIELD_CACHE_MAX_ENTRIES = 16
+# Margin (degrees) kept around the sites when cropping decoded grids; NBM spacing is ~0.03 deg
+WINDOW_PAD_DEG = 0.25
+PREFETCH_FIELDS = ("TMAX", "TMIN", "POP12", "APCP", "ASNOW")
 
 
 class GribIndexEntry(NamedTuple):
@@ -37,39 +65,127 @@ class CycleInfo:
     cycle_hour: str
 
 
-def kelvin_to_f(value: float) -> float:
+# Unit converters are plain arithmetic, so they apply element-wise to a whole sampled ndarray in one pass.
+Converter = Callable[[np.ndarray], np.ndarray]
+
+
+def kelvin_to_f(value: np.ndarray) -> np.ndarray:
     return (value - 273.15) * 9.0 / 5.0 + 32.0
 
 
-def mm_to_inches(value: float) -> float:
+def mm_to_inches(value: np.ndarray) -> np.ndarray:
     return value * MM_TO_INCH
 
 
-def meters_to_inches(value: float) -> float:
+def meters_to_inches(value: np.ndarray) -> np.ndarray:
     return value * 39.3701
 
 
+# 12-hour precipitation fields sampled at each day's window ends, with the converter each one needs
+PRECIP_FIELDS: Dict[str, Converter | None] = {"POP12": None, "APCP": mm_to_inches, "ASNOW": meters_to_inches}
+
+
+def precip_hours(day_idx: int) -> Tuple[int, ...]:
+    """Forecast hours ending the 12-hour windows of ``day_idx``; consecutive days never share one."""
+    return (max(day_idx * 24 + FIELD_WINDOW_HOURS, FIELD_WINDOW_HOURS), (day_idx + 1) * 24)
+
+
+def encode_field(data: xr.DataArray) -> bytes:
+    """Serialize a decoded field's values and lat/lon coordinates as an uncompressed ``.npz`` blob."""
+    lat = data.coords["latitude"]
+    lon = data.coords["longitude"]
+    buf = BytesIO()
+    np.savez(
+        buf,
+        values=data.values,
+        dims=np.array(data.dims),
+        latitude=lat.values,
+        latitude_dims=np.array(lat.dims),
+        longitude=lon.values,
+        longitude_dims=np.array(lon.dims),
+    )
+    return buf.getvalue()
+
+
+def decode_field(path: Path) -> xr.DataArray:
+    with np.load(path) as stored:
+        return xr.DataArray(
+            stored["values"],
+            dims=tuple(stored["dims"]),
+            coords={
+                "latitude": (tuple(stored["latitude_dims"]), stored["latitude"]),
+                "longitude": (tuple(stored["longitude_dims"]), stored["longitude"]),
+            },
+        )
+
+
 def parse_index(text: str) -> List[GribIndexEntry]:
-    entries: List[GribIndexEntry] = []
-    for line in filter(None, text.splitlines()):
-        try:
-            number_str, offset_str, *rest = line.split(":")
-            entries.append(GribIndexEntry(int(number_str), int(offset_str), ":".join(rest)))
-        except ValueError:  # pragma: no cover - defensive
+    return [GribIndexEntry(int(number), int(offset), rest) for number, offset, rest in _INDEX_LINE_RE.findall(text)]
+
+
+def index_spans(entries: List[GribIndexEntry]) -> Dict[str, Tuple[int, int | None]]:
+    """Map each field name (``TMAX``, ``APCP``...) to the byte span of its first non-"std dev" message."""
+    spans: Dict[str, Tuple[int, int | None]] = {}
+    for idx, entry in enumerate(entries):
+        if "std dev" in entry.description:
+            continue
+        parts = entry.description.split(":", 2)
+        if len(parts) < 2 or parts[1] in spans:
             continue
-    return entries
+        end = entries[idx + 1].offset - 1 if idx + 1 < len(entries) else None
+        spans[parts[1]] = (entry.offset, end)
+    return spans
+
+
+def site_window(sites: Iterable[SiteSettings], pad: float = WINDOW_PAD_DEG) -> Tuple[float, float, float, float] | None:
+    """Padded ``(lat_min, lat_max, lon_min, lon_max)`` box around ``sites``, or None when there are none."""
+    sites = list(sites)
+    if not sites:
+        return None
+    lats = [site.latitude for site in sites]
+    lons = [site.longitude for site in sites]
+    return (min(lats) - pad, max(lats) + pad, min(lons) - pad, max(lons) + pad)
+
+
+def crop_to_window(data: xr.DataArray, window: Tuple[float, float, float, float]) -> xr.DataArray:
+    """Slice ``data`` down to the index ranges whose grid points fall inside ``window``.
+
+    Works on regular (1-D latitude/longitude) and projected (2-D) grids; an empty match returns ``data`` untouched.
+    """
+    lat_min, lat_max, lon_min, lon_max = window
+    lat = data.coords["latitude"]
+    lon = data.coords["longitude"]
+    if float(lon.max()) > 180:
+        lon_min, lon_max = lon_min % 360, lon_max % 360
+    inside = (lat >= lat_min) & (lat <= lat_max) & (lon >= lon_min) & (lon <= lon_max)
+    bounds = {}
+    for dim in inside.dims:
+        hits = np.flatnonzero(inside.any(dim=[other for other in inside.dims if other != dim]).values)
+        if not hits.size:
+            return data
+        bounds[dim] = slice(int(hits[0]), int(hits[-1]) + 1)
+    return data.isel(bounds)
 
 
 class NBMIngestor:
     source_name = "nbm_grib"
 
-    def __init__(self, session, cache: CacheManager, days: int, tzinfo) -> None:
+    def __init__(
+        self, session, cache: CacheManager, days: int, tzinfo, sites: Iterable[SiteSettings] = ()
+    ) -> None:
         self.session = session
         self.cache = cache
         self.days = days
         self.tzinfo = tzinfo
+        self._sites: List[SiteSettings] = list(sites)
+        self._window = site_window(self._sites)
         self._cycle: CycleInfo | None = None
-        self._field_cache: Dict[Tuple[str, int], Any] = {}
+        self._field_cache: OrderedDict[Tuple[str, int], Any] = OrderedDict()
+        self._field_lock = threading.Lock()
+        self._prefetched: CycleInfo | None = None
+        self._index_spans: Dict[Tuple[str, int], Dict[str, Tuple[int, int | None]]] = {}
+        self._grid_coords: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._site_indices: Dict[Tuple[Any, Tuple[int, ...], float, float], Tuple[int, ...]] = {}
 
     def _build_candidate_cycles(self) -> Iterable[datetime]:
         now = datetime.now(UTC)
@@ -81,12 +197,19 @@ class NBMIngestor:
     def _select_cycle(self) -> CycleInfo:
         if self._cycle:
             return self._cycle
-        for candidate in self._build_candidate_cycles():
-            ymd = candidate.strftime("%Y%m%d")
-            hour = candidate.strftime("%H")
-            test_url = self._idx_url(ymd, hour, 24)
-            resp = self.session.head(test_url, timeout=30)
-            if resp.status_code == 200:
+        candidates = list(self._build_candidate_cycles())
+
+        def _probe(candidate: datetime) -> bool:
+            test_url = self._idx_url(candidate.strftime("%Y%m%d"), candidate.strftime("%H"), 24)
+            return self.session.head(test_url, timeout=30).status_code == 200
+
+        # Probe every candidate at once; map() keeps newest-first order for the pick below.
+        with ThreadPoolExecutor(max_workers=len(candidates), thread_name_prefix="nbm-probe") as pool:
+            available = list(pool.map(_probe, candidates))
+        for candidate, ok in zip(candidates, available):
+            if ok:
+                ymd = candidate.strftime("%Y%m%d")
+                hour = candidate.strftime("%H")
                 self._cycle = CycleInfo(candidate, ymd, hour)
                 LOGGER.info("Selected NBM cycle %s %sz", ymd, hour)
                 return self._cycle
@@ -101,115 +224,356 @@ class NBMIngestor:
     def _cache_namespace(self, cycle: CycleInfo) -> str:
         return f"nbm/{cycle.ymd}/{cycle.cycle_hour}"
 
-    def _load_index(self, cycle: CycleInfo, fhour: int) -> List[GribIndexEntry]:
+    def _load_index(self, cycle: CycleInfo, fhour: int) -> Dict[str, Tuple[int, int | None]]:
         namespace = self._cache_namespace(cycle)
-        def _getter() -> bytes:
-            resp = self.session.get(self._idx_url(cycle.ymd, cycle.cycle_hour, fhour), timeout=60)
-            resp.raise_for_status()
-            return resp.content
+        spans = self._index_spans.get((namespace, fhour))
+        if spans is not None:
+            return spans
+
+        def _getter(headers: Dict[str, str]) -> DownloadResult:
+            resp = self.session.get(self._idx_url(cycle.ymd, cycle.cycle_hour, fhour), headers=headers, timeout=60)
+            return DownloadResult.from_response(resp)
 
-        idx_file = self.cache.fetch(namespace, f"f{fhour:03d}.idx", _getter)
-        return parse_index(idx_file.path.read_text())
+        idx_file = self.cache.fetch_conditional(namespace, f"f{fhour:03d}.idx", _getter)
+        spans = self._index_spans[(namespace, fhour)] = index_spans(parse_index(idx_file.path.read_text()))
+        return spans
+
+    def _get_range(self, url: str, start: int, end: int | None) -> bytes:
+        headers = {"Range": f"bytes={start}-{end}" if end is not None else f"bytes={start}-"}
+        resp = self.session.get(url, headers=headers, timeout=120)
+        resp.raise_for_status()
+        return resp.content
+
+    def _download_range_parallel(self, url: str, namespace: str, name: str, start: int, end: int) -> bytes:
+        """Fetch ``start..end`` as concurrent sub-ranges; each part is cached so a retry only refetches what failed."""
+        spans = [(lo, min(lo + RANGE_CHUNK_BYTES - 1, end)) for lo in range(start, end + 1, RANGE_CHUNK_BYTES)]
+        parts_ns = f"{namespace}/parts"
+
+        def _part(indexed: Tuple[int, Tuple[int, int]]) -> bytes:
+            idx, (lo, hi) = indexed
+            # Straight from disk, not read_bytes: the in-memory memo must not pin every 8 MB part
+            return self.cache.fetch(parts_ns, f"{name}.{idx:03d}", lambda: self._get_range(url, lo, hi)).path.read_bytes()
+
+        buffer = bytearray(end - start + 1)
+        with ThreadPoolExecutor(max_workers=RANGE_WORKERS, thread_name_prefix="nbm-range") as pool:
+            for (lo, _hi), chunk in zip(spans, pool.map(_part, enumerate(spans))):
+                buffer[lo - start : lo - start + len(chunk)] = chunk
+        for idx in range(len(spans)):
+            self.cache.discard(parts_ns, f"{name}.{idx:03d}")
+        return bytes(buffer)
+
+    def _fetch_range(self, url: str, namespace: str, name: str, start: int, end: int | None) -> bytes:
+        if end is not None and end - start + 1 > RANGE_SPLIT_THRESHOLD:
+            return self._download_range_parallel(url, namespace, name, start, end)
+        return self._get_range(url, start, end)
 
     def _download_slice(self, cycle: CycleInfo, fhour: int, start: int, end: int | None, tag: str) -> Path:
         namespace = self._cache_namespace(cycle)
-        headers = {"Range": f"bytes={start}-{end}" if end is not None else f"bytes={start}-"}
+        name = f"f{fhour:03d}_{tag}.grib2"
+        url = self._grib_url(cycle.ymd, cycle.cycle_hour, fhour)
+        slice_file = self.cache.fetch(namespace, name, lambda: self._fetch_range(url, namespace, name, start, end))
+        return slice_file.path
+
+    def _download_bundle(
+        self, cycle: CycleInfo, fhour: int, spans: Dict[str, Tuple[int, int | None]]
+    ) -> Path:
+        """Concatenate several GRIB messages into one file, fetching neighbouring messages with a single GET.
+
+        Only the requested messages are kept (GRIB2 files are plain message sequences), so a
+        ``shortName`` filter on the bundle matches exactly what a per-field slice would.
+        """
+        namespace = self._cache_namespace(cycle)
+        ordered = sorted(spans.items(), key=lambda item: item[1][0])
+        name = f"f{fhour:03d}_bundle_{'-'.join(short.lower() for short, _ in ordered)}.grib2"
+        url = self._grib_url(cycle.ymd, cycle.cycle_hour, fhour)
+
+        runs: List[List[Tuple[int, int | None]]] = []
+        for _short, (start, end) in ordered:
+            last = runs[-1][-1] if runs else None
+            if last is not None and last[1] is not None and start - last[1] - 1 <= BUNDLE_MAX_GAP_BYTES:
+                runs[-1].append((start, end))
+            else:
+                runs.append([(start, end)])
+
         def _getter() -> bytes:
-            resp = self.session.get(self._grib_url(cycle.ymd, cycle.cycle_hour, fhour), headers=headers, timeout=120)
-            resp.raise_for_status()
-            return resp.content
+            parts: List[bytes] = []
+            for run_idx, run in enumerate(runs):
+                lo, hi = run[0][0], run[-1][1]
+                blob = self._fetch_range(url, namespace, f"{name}.run{run_idx}", lo, hi)
+                for start, end in run:
+                    parts.append(blob[start - lo : None if end is None else end - lo + 1])
+            return b"".join(parts)
 
-        slice_file = self.cache.fetch(namespace, f"f{fhour:03d}_{tag}.grib2", _getter)
-        return slice_file.path
+        return self.cache.fetch(namespace, name, _getter).path
 
-    def _find_entry(self, entries: List[GribIndexEntry], token: str) -> Tuple[int, int | None]:
-        for idx, entry in enumerate(entries):
-            if token not in entry.description or "std dev" in entry.description:
-                continue
-            start = entry.offset
-            end = entries[idx + 1].offset - 1 if idx + 1 < len(entries) else None
-            return start, end
-        raise RuntimeError(f"Field {token} not present in GRIB index")
+    @staticmethod
+    def _find_entry(spans: Dict[str, Tuple[int, int | None]], short_name: str) -> Tuple[int, int | None]:
+        try:
+            return spans[short_name]
+        except KeyError:
+            raise RuntimeError(f"Field :{short_name}: not present in GRIB index") from None
 
-    def _load_data(self, cycle: CycleInfo, fhour: int, short_name: str):
+    @staticmethod
+    def _require_xarray() -> None:
         if xr is None:  # pragma: no cover - import-time guard
             raise RuntimeError(
                 "xarray/cfgrib are required for GRIB ingest. Install optional deps: pip install xarray cfgrib eccodes"
             )
-        key = (short_name, fhour)
-        if key in self._field_cache:
-            return self._field_cache[key]
-        entries = self._load_index(cycle, fhour)
-        start, end = self._find_entry(entries, f":{short_name}:")
-        grib_path = self._download_slice(cycle, fhour, start, end, short_name.lower())
+
+    def _coords_for(self, handle, shape: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+        # Every NBM field shares one grid; its lat/lon arrays are computed once, keyed by the grid section hash.
+        key = eccodes.codes_get(handle, "md5GridSection")
+        coords = self._grid_coords.get(key)
+        if coords is None:
+            lat = eccodes.codes_get_double_array(handle, "latitudes").reshape(shape)
+            lon = eccodes.codes_get_double_array(handle, "longitudes").reshape(shape)
+            coords = self._grid_coords[key] = (lat, lon)
+        return coords
+
+    def _read_message(self, grib_path: Path, short_name: str) -> xr.DataArray:
+        """Decode the first ``short_name`` message with the eccodes API, skipping cfgrib's Dataset build."""
+        with open(grib_path, "rb") as fh:
+            while (handle := eccodes.codes_grib_new_from_file(fh)) is not None:
+                try:
+                    if eccodes.codes_get(handle, "shortName") != short_name:
+                        continue
+                    shape = (eccodes.codes_get(handle, "Nj"), eccodes.codes_get(handle, "Ni"))
+                    values = eccodes.codes_get_values(handle).reshape(shape)
+                    if eccodes.codes_get(handle, "bitmapPresent"):
+                        values[values == eccodes.codes_get(handle, "missingValue")] = np.nan
+                    lat, lon = self._coords_for(handle, shape)
+                finally:
+                    eccodes.codes_release(handle)
+                return xr.DataArray(
+                    values,
+                    dims=("y", "x"),
+                    coords={"latitude": (("y", "x"), lat), "longitude": (("y", "x"), lon)},
+                    name=short_name.lower(),
+                )
+        raise RuntimeError(f"Field {short_name} not present in {grib_path.name}")
+
+    def _open_field(self, grib_path: Path, short_name: str):
+        if eccodes is not None:
+            data = self._read_message(grib_path, short_name)
+            return data if self._window is None else crop_to_window(data, self._window).copy()
         ds = xr.open_dataset(
             grib_path,
             engine="cfgrib",
             backend_kwargs={"filter_by_keys": {"shortName": short_name}},
         )
         var_name = next(iter(ds.data_vars))
-        data = ds[var_name].load()
+        data = ds[var_name]
+        if self._window is not None:
+            # Values stay lazy until .load(), so only the sites' neighbourhood is decoded into memory.
+            data = crop_to_window(data, self._window)
+        data = data.load()
         ds.close()
-        self._field_cache[key] = data
         return data
 
-    def _extract_value(self, data: xr.DataArray, lat: float, lon: float) -> float:
-        point = data.sel(latitude=lat, longitude=lon, method="nearest")
-        return float(point.values)
+    def _field_name(self, fhour: int, short_name: str) -> str:
+        if self._window is None:
+            return f"f{fhour:03d}_{short_name.lower()}.npz"
+        window = "_".join(f"{bound:.3f}" for bound in self._window)
+        return f"f{fhour:03d}_{short_name.lower()}.{hashlib.sha1(window.encode()).hexdigest()[:10]}.npz"
+
+    def _cover(self, site: SiteSettings) -> None:
+        """Grow the crop window when asked for a site outside it; cached crops no longer apply then."""
+        with self._field_lock:
+            if self._window is None or site in self._sites:
+                return
+            self._sites.append(site)
+            window = site_window(self._sites)
+            if window != self._window:
+                self._window = window
+                self._field_cache.clear()
+                self._site_indices.clear()
+
+    def _remember_fields(self, fields: Dict[Tuple[str, int], Any]) -> None:
+        with self._field_lock:
+            for key, data in fields.items():
+                self._field_cache[key] = data
+                self._field_cache.move_to_end(key)
+            while len(self._field_cache) > FIELD_CACHE_MAX_ENTRIES:
+                self._field_cache.popitem(last=False)
+
+    def _decoded_field(self, cycle: CycleInfo, fhour: int, short_name: str, grib_path: Callable[[], Path]):
+        """Return a field from its persisted ``.npz`` decode, running cfgrib on ``grib_path()`` only on a miss."""
+        decoded: Dict[str, Any] = {}
+
+        def _getter() -> bytes:
+            decoded["data"] = data = self._open_field(grib_path(), short_name)
+            return encode_field(data)
+
+        cached = self.cache.fetch(self._cache_namespace(cycle), self._field_name(fhour, short_name), _getter)
+        return decoded["data"] if "data" in decoded else decode_field(cached.path)
+
+    def _load_data(self, cycle: CycleInfo, fhour: int, short_name: str):
+        self._require_xarray()
+        key = (short_name, fhour)
+        with self._field_lock:
+            if key in self._field_cache:
+                self._field_cache.move_to_end(key)
+                return self._field_cache[key]
+
+        def _grib_path() -> Path:
+            start, end = self._find_entry(self._load_index(cycle, fhour), short_name)
+            return self._download_slice(cycle, fhour, start, end, short_name.lower())
+
+        data = self._decoded_field(cycle, fhour, short_name, _grib_path)
+        self._remember_fields({key: data})
+        return data
+
+    def _load_fields(self, cycle: CycleInfo, fhour: int, short_names: Iterable[str]) -> None:
+        """Warm ``_field_cache`` for several fields of one forecast hour from a single bundled download."""
+        self._require_xarray()
+        with self._field_lock:
+            wanted = [name for name in short_names if (name, fhour) not in self._field_cache]
+        if not wanted:
+            return
+        index = self._load_index(cycle, fhour)
+        spans: Dict[str, Tuple[int, int | None]] = {}
+        for short_name in wanted:
+            try:
+                spans[short_name] = self._find_entry(index, short_name)
+            except RuntimeError as exc:
+                LOGGER.debug("NBM prefetch skipped %s fhour=%s: %s", short_name, fhour, exc)
+        if not spans:
+            return
+        bundle: List[Path] = []
+
+        def _bundle_path() -> Path:
+            # Only downloaded if some field has no persisted decode yet.
+            if not bundle:
+                bundle.append(self._download_bundle(cycle, fhour, spans))
+            return bundle[0]
+
+        # eccodes walks the bundle message by message; the cfgrib fallback reuses the header index it writes beside it.
+        loaded = {
+            (short_name, fhour): self._decoded_field(cycle, fhour, short_name, _bundle_path) for short_name in spans
+        }
+        self._remember_fields(loaded)
+
+    def _prefetch(self, cycle: CycleInfo) -> None:
+        """Download and decode every routinely sampled field concurrently, one bundle per forecast hour."""
+        if self._prefetched is cycle:
+            return
+        self._prefetched = cycle
+        jobs: Dict[int, set] = {}
+        for day_idx in range(self.days):
+            jobs.setdefault((day_idx + 1) * 24, set()).add("TMAX")
+            jobs.setdefault(day_idx * 24 + FIELD_WINDOW_HOURS, set()).add("TMIN")
+            for fhour in precip_hours(day_idx):
+                jobs.setdefault(fhour, set()).update(PRECIP_FIELDS)
+
+        def _load(fhour: int) -> None:
+            short_names = [name for name in PREFETCH_FIELDS if name in jobs[fhour]]
+            try:
+                self._load_fields(cycle, fhour, short_names)
+            except Exception as exc:  # pragma: no cover - the sequential pass reports failures
+                LOGGER.debug("NBM prefetch failed for fhour=%s: %s", fhour, exc)
+
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS, thread_name_prefix="nbm-fetch") as pool:
+            list(pool.map(_load, sorted(jobs)))
+
+    @staticmethod
+    def _nearest_cell(data: xr.DataArray, lat: float, lon: float) -> Tuple[int, ...]:
+        lat_coord = data.coords["latitude"]
+        lon_coord = data.coords["longitude"]
+        lon_values = lon_coord.values
+        # cfgrib reports NBM longitudes on 0..360
+        if np.nanmax(lon_values) > 180:
+            lon = lon % 360
+        if lat_coord.ndim == 1 and lon_coord.ndim == 1:
+            position = {
+                lat_coord.dims[0]: int(np.abs(lat_coord.values - lat).argmin()),
+                lon_coord.dims[0]: int(np.abs(lon_values - lon).argmin()),
+            }
+        else:
+            # Projected (Lambert) grid: 2-D lat/lon, so search the whole field once.
+            dist = (lat_coord.values - lat) ** 2 + ((lon_values - lon) * np.cos(np.radians(lat))) ** 2
+            flat = np.unravel_index(int(np.nanargmin(dist)), dist.shape)
+            position = dict(zip(lat_coord.dims, (int(i) for i in flat)))
+        return tuple(position[dim] for dim in data.dims)
+
+    def _extract_values(self, data: xr.DataArray, sites: List[SiteSettings]) -> np.ndarray:
+        """Gather every site's cell with one fancy index; cell lookups are cached per crop window."""
+        cells = []
+        window = self._window
+        for site in sites:
+            key = (window, data.shape, site.latitude, site.longitude)
+            cell = self._site_indices.get(key)
+            if cell is None:
+                cell = self._site_indices[key] = self._nearest_cell(data, site.latitude, site.longitude)
+            cells.append(cell)
+        return data.values[tuple(np.array(axis) for axis in zip(*cells))]
 
     def _sample_field(
         self,
         sites: Iterable[SiteSettings],
         fhour: int,
         short_name: str,
-        converter: Callable[[float], float] | None = None,
+        converter: Converter | None = None,
     ) -> Dict[str, float]:
         cycle = self._select_cycle()
         data = self._load_data(cycle, fhour, short_name)
-        samples: Dict[str, float] = {}
-        for site in sites:
-            value = self._extract_value(data, site.latitude, site.longitude)
-            if converter:
-                value = converter(value)
-            samples[site.name] = value
-        return samples
+        sites = list(sites)
+        values = self._extract_values(data, sites)
+        if converter:
+            values = converter(values)
+        return {site.name: value for site, value in zip(sites, values.tolist())}
 
     def _sample_optional(
         self,
-        site: SiteSettings,
+        sites: List[SiteSettings],
         fhour: int,
         short_name: str,
-        converter: Callable[[float], float] | None = None,
-    ) -> float | None:
+        converter: Converter | None = None,
+    ) -> Dict[str, float]:
         try:
-            return self._sample_field([site], fhour, short_name, converter=converter)[site.name]
+            return self._sample_field(sites, fhour, short_name, converter=converter)
         except Exception as exc:  # pragma: no cover - best effort ancillary fields
             LOGGER.debug(
-                "NBM sample failed for %s %s fhour=%s: %s: %s",
+                "NBM sample failed for %s fhour=%s: %s: %s",
                 short_name,
-                site.name,
                 fhour,
                 type(exc).__name__,
                 exc,
             )
-            return None
+            return {}
 
-    def _derive_daily_temp(self, site: SiteSettings, day_idx: int, mode: str) -> float | None:
+    def _derive_daily_temp(self, sites: List[SiteSettings], day_idx: int, mode: str) -> Dict[str, float]:
         """Approximate daily highs/lows using 3-hour TMP fields when max/min slices are missing."""
         start_hour = day_idx * 24
         end_hour = (day_idx + 1) * 24
-        temps: List[float] = []
+        temps: Dict[str, List[float]] = {}
         hours: List[int] = []
         if start_hour == 0:
             hours.append(0)
         hours.extend(range(max(3, start_hour + 3), end_hour + 1, TMP_SAMPLE_STEP))
         for fhour in hours:
-            value = self._sample_optional(site, fhour, "TMP", converter=kelvin_to_f)
-            if value is not None:
-                temps.append(value)
-        if not temps:
-            return None
-        return max(temps) if mode == "high" else min(temps)
+            for name, value in self._sample_optional(sites, fhour, "TMP", converter=kelvin_to_f).items():
+                temps.setdefault(name, []).append(value)
+        pick = max if mode == "high" else min
+        return {name: pick(values) for name, values in temps.items()}
+
+    def _sample_daily_temp(
+        self, sites: List[SiteSettings], day_idx: int, fhour: int, short_name: str, fallback: str, mode: str
+    ) -> Dict[str, float]:
+        """Sample ``short_name``, then ``fallback``, then derive from 3-hour TMP; every site shares one attempt."""
+        try:
+            return self._sample_field(sites, fhour, short_name, converter=kelvin_to_f)
+        except Exception as exc:
+            LOGGER.warning("Unable to sample %s for day %s: %s", short_name, day_idx, exc)
+        try:
+            values = self._sample_field(sites, fhour, fallback, converter=kelvin_to_f)
+            LOGGER.info("NBM fallback %s used for day %s", fallback, day_idx)
+            return values
+        except Exception as exc:
+            LOGGER.debug("NBM fallback %s failed for day %s: %s", fallback, day_idx, exc)
+        derived = self._derive_daily_temp(sites, day_idx, mode)
+        if derived:
+            LOGGER.info("NBM derived TMP %s used for day %s", mode, day_idx)
+        return derived
 
     @staticmethod
     def _append_note(record: SourceDailyRecord, fragment: str) -> None:
@@ -222,87 +586,73 @@ class NBMIngestor:
             record.precip_notes = fragment
 
     def fetch(self, site: SiteSettings) -> List[SourceDailyRecord]:
+        return self.fetch_many([site])[site.name]
+
+    def fetch_many(self, sites: Iterable[SiteSettings]) -> Dict[str, List[SourceDailyRecord]]:
+        """Build every site's daily records in one pass; each field is sampled for all sites at once."""
+        sites = list(sites)
         cycle = self._select_cycle()
-        LOGGER.info("Fetching NBM slices for %s", site.name)
-        records: Dict[date, SourceDailyRecord] = {}
+        LOGGER.info("Fetching NBM slices for %s", ", ".join(site.name for site in sites))
+        for site in sites:
+            self._cover(site)
+        if xr is not None:
+            self._prefetch(cycle)
+        records: Dict[str, Dict[date, SourceDailyRecord]] = {site.name: {} for site in sites}
         base_day = cycle.when.astimezone(self.tzinfo).date()
+        # Each distinct (field, fhour) precipitation sample is taken once up front; the daily loop only reads it.
+        precip_needs = sorted({fhour for day_idx in range(self.days) for fhour in precip_hours(day_idx)})
+        precip = {
+            (short_name, fhour): self._sample_optional(sites, fhour, short_name, converter=converter)
+            for fhour in precip_needs
+            for short_name, converter in PRECIP_FIELDS.items()
+        }
         for day_idx in range(self.days):
             # High temps from 12h windows ending at multiples of 24h
             high_hour = (day_idx + 1) * 24
             low_hour = day_idx * 24 + FIELD_WINDOW_HOURS
             target_day = base_day + timedelta(days=day_idx)
-
-            # Ensure the record exists so we can still use PoP/QPF/Snow even if highs/lows fail
-            rec = records.setdefault(
-                target_day,
-                SourceDailyRecord(
-                    site_name=site.name,
-                    date=target_day,
-                    label=format_day_label(target_day),
-                    source=self.source_name,
-                ),
-            )
-
-            # High temperature with fallbacks
-            high_value = None
-            try:
-                high_value = self._sample_field([site], high_hour, "TMAX", converter=kelvin_to_f)[site.name]
-            except Exception as exc:
-                LOGGER.warning("Unable to sample TMAX for day %s: %s", day_idx, exc)
-                try:
-                    high_value = self._sample_field([site], high_hour, "MAXT", converter=kelvin_to_f)[site.name]
-                    LOGGER.info("NBM fallback MAXT used for day %s", day_idx)
-                except Exception as exc2:
-                    LOGGER.debug("NBM fallback MAXT failed for day %s: %s", day_idx, exc2)
-            if high_value is not None:
-                rec.high_f = high_value
-            else:
-                derived_high = self._derive_daily_temp(site, day_idx, "high")
-                if derived_high is not None:
-                    rec.high_f = derived_high
-                    LOGGER.info("NBM derived TMP high used for day %s", day_idx)
-
-            # Low temperature with fallbacks
-            try:
-                low_value = self._sample_field([site], low_hour, "TMIN", converter=kelvin_to_f)[site.name]
-                rec.low_f = low_value
-            except Exception as exc:
-                LOGGER.warning("Unable to sample TMIN for day %s: %s", day_idx, exc)
-                try:
-                    low_value = self._sample_field([site], low_hour, "MINT", converter=kelvin_to_f)[site.name]
-                    rec.low_f = low_value
-                    LOGGER.info("NBM fallback MINT used for day %s", day_idx)
-                except Exception as exc2:
-                    LOGGER.debug("NBM fallback MINT failed for day %s: %s", day_idx, exc2)
-                    derived_low = self._derive_daily_temp(site, day_idx, "low")
-                    if derived_low is not None:
-                        rec.low_f = derived_low
-                        LOGGER.info("NBM derived TMP low used for day %s", day_idx)
-            pop_hours = {max(day_idx * 24 + FIELD_WINDOW_HOURS, FIELD_WINDOW_HOURS), (day_idx + 1) * 24}
-            pop_values: List[float] = []
-            qpf_total_inches = 0.0
-            snow_total_inches = 0.0
-            for fhour in pop_hours:
-                pop_val = self._sample_optional(site, fhour, "POP12")
-                if pop_val is not None:
-                    pop_values.append(pop_val)
-                qpf_mm = self._sample_optional(site, fhour, "APCP")
-                if qpf_mm is not None:
-                    qpf_total_inches += mm_to_inches(qpf_mm)
-                snow_m = self._sample_optional(site, fhour, "ASNOW")
-                if snow_m is not None:
-                    snow_total_inches += meters_to_inches(snow_m)
-            if pop_values:
-                best_pop = max(pop_values)
-                rec.pop_pct = max(rec.pop_pct or 0, best_pop)
-            note_frags: List[str] = []
-            if qpf_total_inches > 0:
-                rec.qpf_inches = round(qpf_total_inches, 2)
-                note_frags.append(f"NBM QPF {rec.qpf_inches:.2f}\"")
-            if snow_total_inches > 0:
-                rec.snow_inches = round(snow_total_inches, 2)
-                note_frags.append(f"NBM Snow {rec.snow_inches:.2f}\"")
-            if note_frags:
-                self._append_note(rec, "; ".join(note_frags))
-        ordered = sorted(records.keys())[: self.days]
-        return [records[d] for d in ordered]
+            highs = self._sample_daily_temp(sites, day_idx, high_hour, "TMAX", "MAXT", "high")
+            lows = self._sample_daily_temp(sites, day_idx, low_hour, "TMIN", "MINT", "low")
+
+            for site in sites:
+                # Ensure the record exists so we can still use PoP/QPF/Snow even if highs/lows fail
+                rec = records[site.name].setdefault(
+                    target_day,
+                    SourceDailyRecord(
+                        site_name=sys.intern(site.name),
+                        date=target_day,
+                        label=format_day_label(target_day),
+                        source=self.source_name,
+                    ),
+                )
+                if site.name in highs:
+                    rec.high_f = highs[site.name]
+                if site.name in lows:
+                    rec.low_f = lows[site.name]
+                pop_values: List[float] = []
+                qpf_total_inches = 0.0
+                snow_total_inches = 0.0
+                for fhour in precip_hours(day_idx):
+                    pop_val = precip[("POP12", fhour)].get(site.name)
+                    if pop_val is not None:
+                        pop_values.append(pop_val)
+                    qpf_inches = precip[("APCP", fhour)].get(site.name)
+                    if qpf_inches is not None:
+                        qpf_total_inches += qpf_inches
+                    snow_inches = precip[("ASNOW", fhour)].get(site.name)
+                    if snow_inches is not None:
+                        snow_total_inches += snow_inches
+                if pop_values:
+                    best_pop = max(pop_values)
+                    rec.pop_pct = max(rec.pop_pct or 0, best_pop)
+                note_frags: List[str] = []
+                if qpf_total_inches > 0:
+                    rec.qpf_inches = round(qpf_total_inches, 2)
+                    note_frags.append(f"NBM QPF {rec.qpf_inches:.2f}\"")
+                if snow_total_inches > 0:
+                    rec.snow_inches = round(snow_total_inches, 2)
+                    note_frags.append(f"NBM Snow {rec.snow_inches:.2f}\"")
+                if note_frags:
+                    self._append_note(rec, "; ".join(note_frags))
+        # Days were inserted in ascending order, one per day_idx, so the values are already the answer.
+        return {name: list(site_records.values()) for name, site_records in records.items()}
@@ -1,59 +1,55 @@
 from __future__ import annotations
 
-import json
 import logging
-import re
+import sys
 from collections import defaultdict
-from datetime import date, datetime, timedelta
-from typing import Dict, Iterable, List, Tuple
+from datetime import UTC, date, datetime
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Tuple
 
-from dateutil import parser as dtparser
+import numpy as np
+import orjson
 
 from ..config import SiteSettings
 from ..models import SourceDailyRecord
 from ..util.time import format_day_label
-from .cache import CacheManager
+from .cache import CacheManager, DownloadResult
 
 LOGGER = logging.getLogger(__name__)
 POINTS_URL = "https://api.weather.gov/points"
-DURATION_RE = re.compile(r"P(?:(?P<days>\d+)D)?(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?)?")
 
 
-def c_to_f(value: float | None) -> float | None:
+def c_to_f(value: np.ndarray | float | None) -> np.ndarray | float | None:
     if value is None:
         return None
     return value * 9.0 / 5.0 + 32.0
 
 
-def mm_to_inches(value: float | None) -> float | None:
+def mm_to_inches(value: np.ndarray | float | None) -> np.ndarray | float | None:
     if value is None:
         return None
     return value * 0.0393701
 
 
-def _parse_duration(value: str) -> timedelta:
-    match = DURATION_RE.fullmatch(value)
-    if not match:
-        return timedelta(hours=1)
-    days = int(match.group("days") or 0)
-    hours = int(match.group("hours") or 0)
-    minutes = int(match.group("minutes") or 0)
-    return timedelta(days=days, hours=hours, minutes=minutes)
+@lru_cache(maxsize=256)
+def _coord_slug(latitude: float, longitude: float) -> str:
+    return f"{latitude:.4f}_{longitude:.4f}".replace("-", "m").replace(".", "d")
 
 
-def _parse_period(value: str, tzinfo) -> Tuple[datetime, datetime]:
-    if "/" in value:
-        start_raw, duration_raw = value.split("/", 1)
-        start = dtparser.isoparse(start_raw).astimezone(tzinfo)
-        end = start + _parse_duration(duration_raw)
-    else:
-        start = dtparser.isoparse(value).astimezone(tzinfo)
-        end = start + timedelta(hours=1)
-    return start, end
+@lru_cache(maxsize=4096)
+def _start_day(stamp: str, tzinfo) -> date | None:
+    """Local date an ISO-8601 ``validTime`` start falls on; naive stamps are UTC, unparseable ones give None."""
+    try:
+        start = datetime.fromisoformat(stamp)
+    except ValueError:
+        return None
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=UTC)
+    return start.astimezone(tzinfo).date()
 
 
 def _slug(site: SiteSettings) -> str:
-    return f"{site.latitude:.4f}_{site.longitude:.4f}".replace("-", "m").replace(".", "d")
+    return _coord_slug(site.latitude, site.longitude)
 
 
 def _weather_phrase(entry: Dict[str, str]) -> str | None:
@@ -87,7 +83,7 @@ def _weather_phrase(entry: Dict[str, str]) -> str | None:
 def _ensure_record(bucket: Dict[date, SourceDailyRecord], site: SiteSettings, day: date) -> SourceDailyRecord:
     if day not in bucket:
         bucket[day] = SourceDailyRecord(
-            site_name=site.name,
+            site_name=sys.intern(site.name),
             date=day,
             label=format_day_label(day),
             source="nws_gridpoint",
@@ -104,68 +100,76 @@ class GridpointIngestor:
         self.days = days
         self.tzinfo = tzinfo
 
-    def _download(self, url: str) -> bytes:
-        resp = self.session.get(url, timeout=60)
-        resp.raise_for_status()
-        return resp.content
+    def _download_conditional(self, url: str, headers: Dict[str, str]) -> DownloadResult:
+        resp = self.session.get(url, headers=headers, timeout=60)
+        return DownloadResult.from_response(resp)
 
     def _point_metadata(self, site: SiteSettings) -> dict:
         slug = _slug(site)
-        text = self.cache.read_text(
+        payload = self.cache.read_bytes(
             "gridpoint/meta",
             f"{slug}.json",
-            lambda: self._download(f"{POINTS_URL}/{site.latitude},{site.longitude}"),
+            lambda headers: self._download_conditional(f"{POINTS_URL}/{site.latitude},{site.longitude}", headers),
+            conditional=True,
         )
-        return json.loads(text)
+        return orjson.loads(payload)
 
     def _grid_data(self, grid_url: str, site: SiteSettings) -> dict:
         slug = _slug(site)
-        text = self.cache.read_text(
+        payload = self.cache.read_bytes(
             "gridpoint/data",
             f"{slug}.json",
-            lambda: self._download(grid_url),
+            lambda headers: self._download_conditional(grid_url, headers),
+            conditional=True,
         )
-        return json.loads(text)
+        return orjson.loads(payload)
+
+    def _iter_days(self, values: Iterable[dict]) -> List[Tuple[date, Any]]:
+        """Pair each value with the local date its ``validTime`` period starts on.
 
-    def _iter_periods(self, values: Iterable[dict]) -> Iterable[Tuple[datetime, datetime, float | dict]]:
+        Start stamps repeat across layers, so each is parsed once; the ISO-8601 duration suffix does not affect the day.
+        """
+        pairs: List[Tuple[date, Any]] = []
+        skipped = 0
         for item in values:
-            valid = item.get("validTime")
-            value = item.get("value")
-            if not valid:
+            valid_time = item.get("validTime")
+            if not valid_time:
                 continue
-            try:
-                start, end = _parse_period(valid, self.tzinfo)
-            except Exception as exc:  # pragma: no cover - defensive
-                LOGGER.debug("Unable to parse validTime %s: %s", valid, exc)
+            day = _start_day(valid_time.split("/", 1)[0], self.tzinfo)
+            if day is None:
+                skipped += 1
                 continue
-            yield start, end, value
+            pairs.append((day, item.get("value")))
+        if skipped:
+            LOGGER.debug("Skipping %d unparseable validTime values", skipped)
+        return pairs
 
     def _bucket_numeric(self, values: Iterable[dict], agg: str = "max", transform=None) -> Dict[datetime.date, float]:
-        bucket: Dict[datetime.date, List[float]] = defaultdict(list)
-        for start, _end, raw in self._iter_periods(values):
-            if raw is None:
-                continue
-            val = transform(raw) if transform else raw
-            bucket[start.date()].append(val)
-        summary: Dict[datetime.date, float] = {}
-        for day, items in bucket.items():
-            if not items:
-                continue
-            if agg == "sum":
-                summary[day] = round(sum(items), 2)
-            else:
-                summary[day] = round(max(items), 1)
-        return summary
+        pairs = [(day, raw) for day, raw in self._iter_days(values) if raw is not None]
+        if not pairs:
+            return {}
+        days, inverse = np.unique(np.array([day for day, _ in pairs], dtype="datetime64[D]"), return_inverse=True)
+        vals = np.fromiter((raw for _, raw in pairs), dtype=np.float64, count=len(pairs))
+        if transform:
+            vals = transform(vals)
+        if agg == "sum":
+            totals = np.bincount(inverse, weights=vals, minlength=days.size)
+            digits = 2
+        else:
+            totals = np.full(days.size, -np.inf)
+            np.maximum.at(totals, inverse, vals)
+            digits = 1
+        return {day: round(total, digits) for day, total in zip(days.tolist(), totals.tolist())}
 
     def _bucket_weather(self, values: Iterable[dict]) -> Dict[datetime.date, Tuple[str | None, str]]:
         phrases: Dict[datetime.date, List[str]] = defaultdict(list)
-        for start, _end, payload in self._iter_periods(values):
+        for day, payload in self._iter_days(values):
             if not payload:
                 continue
             for entry in payload:
                 phrase = _weather_phrase(entry)
                 if phrase:
-                    phrases[start.date()].append(phrase)
+                    phrases[day].append(phrase)
         summary: Dict[datetime.date, Tuple[str | None, str]] = {}
         for day, items in phrases.items():
             if not items:
@@ -228,5 +232,5 @@ class GridpointIngestor:
                     existing = record.precip_notes
                     record.precip_notes = " | ".join(filter(None, [existing, notes]))
 
-        ordered = sorted(bucket.keys())[: self.days]
-        return [bucket[d] for d in ordered]
+        # Records were created while walking the sorted day set, so insertion order is date order.
+        return list(bucket.values())[: self.days]
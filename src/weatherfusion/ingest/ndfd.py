@@ -1,13 +1,44 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Iterator
 
 from ..config import AppSettings, SiteSettings
-from .cache import CacheManager
-from .dwml import parse_dwml
+from .cache import CacheManager, DownloadResult
+from .dwml import parse_dwml_path
 
 NDFD_URL = "https://graphical.weather.gov/xml/SOAP_server/ndfdXMLclient.php"
+_NDFD_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+# Request parameters shared by every fetch; only the time window and point vary
+_NDFD_BASE = MappingProxyType(
+    {
+        "product": "time-series",
+        "Unit": "e",
+        "maxt": "maxt",
+        "mint": "mint",
+        "pop12": "pop12",
+        "qpf": "qpf",
+        "snow": "snow",
+        "iceaccum": "iceaccum",
+        "wspd": "wspd",
+        "wgust": "wgust",
+    }
+)
+# Parameter shapes tried in order to improve reliability across NDFD frontends:
+# (whichClient, whether the point goes in one combined listLatLon value)
+_NDFD_ATTEMPTS = (
+    ("NDFDgenLatLonList", False),
+    ("NDFDgen", False),
+    ("NDFDgenLatLonList", True),
+)
+
+
+def _attempt_params(base: Dict[str, str], lat: str, lon: str) -> Iterator[Dict[str, str]]:
+    # Built lazily; the first shape almost always succeeds, so the others are rarely materialized.
+    for client, combined in _NDFD_ATTEMPTS:
+        point = {"listLatLon": f"{lat},{lon}"} if combined else {"lat": lat, "lon": lon}
+        yield {**base, "whichClient": client, **point}
 
 
 class NdfdIngestor:
@@ -18,58 +49,28 @@ class NdfdIngestor:
         self.session = session
         self.cache = cache
 
-    def _download(self, params: Dict[str, str]) -> bytes:
-        resp = self.session.get(NDFD_URL, params=params, timeout=60)
-        resp.raise_for_status()
-        return resp.content
+    def _download(self, params: Dict[str, str], headers: Dict[str, str]) -> DownloadResult:
+        resp = self.session.get(NDFD_URL, params=params, headers=headers, timeout=60, stream=True)
+        return DownloadResult.from_stream(resp)
 
     def fetch(self, site: SiteSettings):
         now = datetime.now(self.settings.tzinfo)
         end = now + timedelta(days=self.settings.days + 1)
+        lat, lon = f"{site.latitude:.4f}", f"{site.longitude:.4f}"
         base = {
-            "product": "time-series",
-            "begin": now.strftime("%Y-%m-%dT%H:%M:%S"),
-            "end": end.strftime("%Y-%m-%dT%H:%M:%S"),
-            "Unit": "e",
-            "maxt": "maxt",
-            "mint": "mint",
-            "pop12": "pop12",
-            "qpf": "qpf",
-            "snow": "snow",
-            "iceaccum": "iceaccum",
-            "wspd": "wspd",
-            "wgust": "wgust",
+            **_NDFD_BASE,
+            "begin": now.strftime(_NDFD_TIME_FORMAT),
+            "end": end.strftime(_NDFD_TIME_FORMAT),
         }
-        # Try a sequence of parameter shapes to improve reliability across NDFD frontends
-        attempts: list[Dict[str, str]] = []
-        # 1) Original form: NDFDgenLatLonList with lat/lon keys
-        attempts.append({
-            **base,
-            "whichClient": "NDFDgenLatLonList",
-            "lat": f"{site.latitude:.4f}",
-            "lon": f"{site.longitude:.4f}",
-        })
-        # 2) NDFDgen with lat/lon
-        attempts.append({
-            **base,
-            "whichClient": "NDFDgen",
-            "lat": f"{site.latitude:.4f}",
-            "lon": f"{site.longitude:.4f}",
-        })
-        # 3) NDFDgenLatLonList with listLatLon combined param
-        attempts.append({
-            **base,
-            "whichClient": "NDFDgenLatLonList",
-            "listLatLon": f"{site.latitude:.4f},{site.longitude:.4f}",
-        })
-        slug = f"{site.latitude:.4f}_{site.longitude:.4f}".replace("-", "m").replace(".", "d")
+        slug = f"{lat}_{lon}".replace("-", "m").replace(".", "d")
         last_exc: Exception | None = None
-        for idx, params in enumerate(attempts, start=1):
+        # A fresh cache entry returns on the first attempt without calling the downloader.
+        for params in _attempt_params(base, lat, lon):
             try:
-                text = self.cache.read_text(
+                cached = self.cache.fetch_conditional(
                     "ndfd",
                     f"{slug}.xml",
-                    lambda params=params: self._download(params),
+                    lambda headers, params=params: self._download(params, headers),
                 )
                 break
             except Exception as exc:  # pragma: no cover - network variability
@@ -78,4 +79,9 @@ class NdfdIngestor:
         else:
             # Exhausted attempts
             raise last_exc  # type: ignore[misc]
-        return parse_dwml(text, site, self.settings.days, self.settings.tzinfo, self.source_name)
+        days, tzinfo = self.settings.days, self.settings.tzinfo
+        return self.cache.parsed(
+            cached.path,
+            ("dwml", site.name, days, str(tzinfo), self.source_name),
+            lambda: parse_dwml_path(cached.path, site, days, tzinfo, self.source_name),
+        )
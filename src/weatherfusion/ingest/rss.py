@@ -1,71 +1,135 @@
 from __future__ import annotations
 
-import calendar
 import logging
 import re
+import sys
 from collections import defaultdict
 from dataclasses import dataclass
-from datetime import date, datetime
-from typing import Dict, Iterable, List, Tuple
+from datetime import UTC, date, datetime
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Tuple
 
-import feedparser
 from dateutil import parser as dtparser
+from lxml import etree
 
 from ..config import AppSettings, SiteSettings
 from ..models import SourceDailyRecord
 from ..util.time import format_day_label
-from .cache import CacheManager
-from .dwml import parse_dwml
+from .cache import CacheManager, DownloadResult
+from .dwml import FEED_CHUNK_CHARS, parse_dwml
 
 LOGGER = logging.getLogger(__name__)
 RSS_URL = "https://forecast.weather.gov/MapClick.php"
-
-
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+# Matched against the lowercased entry text
+_TEMP_RE = re.compile(r"(high|low)\s*:?\s*(\-?\d+)\s*°?f")
+_POP_RE = re.compile(r"(\d+)%")
+# Checked in order; the first keyword found names the type
+_PRECIP_KEYWORDS = (
+    ("snow", "Snow"),
+    ("freezing", "Freezing Rain"),
+    ("sleet", "Sleet"),
+    ("ice", "Ice Pellets"),
+    ("rain", "Rain"),
+)
+_WIND_RE = re.compile(r"breezy|wind|gust")
+# RSS 2.0 <item> and Atom <entry>; only these elements are ever materialized
+_ITEM_TAGS = ("item", "{http://www.w3.org/2005/Atom}entry")
+_FEED_ROOTS = frozenset({"rss", "{http://www.w3.org/2005/Atom}feed"})
+
+
+@lru_cache(maxsize=256)
 def _slug(name: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "-", name.lower())
+    return _SLUG_RE.sub("-", name.lower())
 
 
-
-def parse_rss(text: str, site: SiteSettings, days: int, tzinfo) -> List[SourceDailyRecord]:
-    feed = feedparser.parse(text)
-    daily: Dict[date, SourceDailyRecord] = {}
-    temp_pattern = re.compile(r"(High|Low)\s*:?\s*(\-?\d+)\s*°?F", re.IGNORECASE)
-
-    for entry in feed.entries:
-        ts_raw = entry.get("published") or entry.get("updated")
-        if ts_raw:
-            ts = dtparser.isoparse(ts_raw).astimezone(tzinfo)
-        elif entry.get("published_parsed"):
-            ts = datetime.fromtimestamp(calendar.timegm(entry.published_parsed), tzinfo)
+def _ensure_record(bucket: Dict[date, SourceDailyRecord], site: SiteSettings, day: date) -> SourceDailyRecord:
+    if day not in bucket:
+        bucket[day] = SourceDailyRecord(
+            site_name=sys.intern(site.name),
+            date=day,
+            label=format_day_label(day),
+            source="nws_rss",
+        )
+    return bucket[day]
+
+
+@lru_cache(maxsize=1024)
+def _parse_timestamp(raw: str, tzinfo) -> datetime | None:
+    try:
+        ts = dtparser.isoparse(raw)
+    except ValueError:
+        # RSS 2.0 pubDate is RFC 822 ("Thu, 15 Oct 2026 18:00:00 -0400")
+        try:
+            ts = parsedate_to_datetime(raw)
+        except (TypeError, ValueError):
+            return None
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=UTC)
+    return ts.astimezone(tzinfo)
+
+
+def _iter_rss_items(text: str | bytes) -> Iterator[Tuple[str | None, str, str]]:
+    """Yield ``(timestamp, title, summary)`` per feed item, streaming and discarding each element as it closes."""
+    parser = etree.XMLPullParser(events=("end",), tag=_ITEM_TAGS, recover=True)
+    chunks = (text[start : start + FEED_CHUNK_CHARS] for start in range(0, len(text), FEED_CHUNK_CHARS))
+    for chunk in (*chunks, None):
+        if chunk is None:
+            parser.close()
         else:
+            parser.feed(chunk)
+        for _event, elem in parser.read_events():
+            fields: Dict[str, str] = {}
+            for child in elem.iterchildren(tag=etree.Element):
+                fields.setdefault(etree.QName(child).localname, (child.text or "").strip())
+            timestamp = fields.get("pubDate") or fields.get("published") or fields.get("updated")
+            yield timestamp or None, fields.get("title", ""), fields.get("description") or fields.get("summary", "")
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+
+def _root_tag(payload: bytes) -> str | None:
+    """Tag of the document element, parsing only as much of the payload as it takes to reach it."""
+    parser = etree.XMLPullParser(events=("start",), recover=True)
+    for start in range(0, len(payload), FEED_CHUNK_CHARS):
+        parser.feed(payload[start : start + FEED_CHUNK_CHARS])
+        for _event, elem in parser.read_events():
+            return elem.tag
+    return None
+
+
+def parse_rss(text: str | bytes, site: SiteSettings, days: int, tzinfo) -> List[SourceDailyRecord]:
+    daily: Dict[date, SourceDailyRecord] = {}
+
+    for ts_raw, title, summary in _iter_rss_items(text):
+        ts = _parse_timestamp(ts_raw, tzinfo) if ts_raw else None
+        if ts is None:
             continue
         day = ts.date()
         record = _ensure_record(daily, site, day)
-        text = " ".join(filter(None, [entry.get("title") or "", entry.get("summary") or ""]))
-        for match in temp_pattern.finditer(text):
+        text = " ".join(filter(None, [title, summary]))
+        lowered = text.lower()
+        for match in _TEMP_RE.finditer(lowered):
             kind, value = match.groups()
             deg = float(value)
-            if kind.lower() == "high":
+            if kind == "high":
                 record.high_f = deg
             else:
                 record.low_f = deg
-        pop_match = re.search(r"(\d+)%", text)
+        pop_match = _POP_RE.search(lowered)
         if pop_match:
             pop = float(pop_match.group(1))
-            record.pop_pct = max(record.pop_pct or 0, pop)
+            if record.pop_pct is None or pop > record.pop_pct:
+                record.pop_pct = pop
         # precipitation keywords
-        for keyword, label in {
-            "snow": "Snow",
-            "freezing": "Freezing Rain",
-            "sleet": "Sleet",
-            "ice": "Ice Pellets",
-            "rain": "Rain",
-        }.items():
-            if keyword in text.lower():
+        for keyword, label in _PRECIP_KEYWORDS:
+            if keyword in lowered:
                 record.precip_type = label
                 break
         record.precip_notes = text.strip()
-        if any(token in text.lower() for token in ("breezy", "wind", "gust")):
+        if _WIND_RE.search(lowered):
             record.wind_phrase = text.strip()
 
     ordered_days = sorted(daily.keys())[:days]
@@ -82,20 +146,23 @@ class RSSIngestor:
         self.days = settings.days
         self.tzinfo = settings.tzinfo
 
-    def _download_feed(self, site: SiteSettings) -> str:
+    def _download_feed(self, site: SiteSettings) -> Tuple[bytes, str | None]:
         params = {
             "lat": site.latitude,
             "lon": site.longitude,
             "FcstType": "rss",
         }
-        slug = _slug(site.name)
-        cached = self.cache.fetch(
+        name = f"{_slug(site.name)}.xml"
+        # Bytes are handed to the parsers untouched so lxml honours the feed's declared encoding.
+        payload = self.cache.read_bytes(
             "rss",
-            f"{slug}.xml",
-            lambda: self._http_get(params),
+            name,
+            lambda headers: self._http_get(params, headers),
+            conditional=True,
         )
-        text = cached.path.read_text()
-        if "<rss" not in text.lower():
+        root = _root_tag(payload)
+        # A DWML root means an earlier run already fell back and cached the result
+        if root not in _FEED_ROOTS and root != "dwml":
             LOGGER.warning("MapClick RSS unavailable for %s, falling back to DWML", site.name)
             dwml = self.session.get(
                 RSS_URL,
@@ -103,17 +170,23 @@ class RSSIngestor:
                 timeout=60,
             )
             dwml.raise_for_status()
-            text = dwml.text
-            cached.path.write_text(text)
-        return text
+            payload = dwml.content
+            cached = self.cache.store("rss", name, payload)
+            # The stored validators describe the RSS error page, not this DWML; a 304 must not pin it.
+            self.cache.drop_validators(cached.path)
+            root = "dwml"
+        return payload, root
 
-    def _http_get(self, params: Dict[str, str]) -> bytes:
-        resp = self.session.get(RSS_URL, params=params, timeout=60)
-        resp.raise_for_status()
-        return resp.text.encode("utf-8")
+    def _http_get(self, params: Dict[str, str], headers: Dict[str, str]) -> DownloadResult:
+        resp = self.session.get(RSS_URL, params=params, headers=headers, timeout=60, stream=True)
+        return DownloadResult.from_stream(resp)
 
     def fetch(self, site: SiteSettings) -> List[SourceDailyRecord]:
-        payload = self._download_feed(site)
-        if "<rss" in payload.lower():
-            return parse_rss(payload, site, self.days, self.tzinfo)
-        return parse_dwml(payload, site, self.days, self.tzinfo, self.source_name)
+        payload, root = self._download_feed(site)
+        if root in _FEED_ROOTS:
+            key = ("rss", site.name, self.days, str(self.tzinfo))
+            return self.cache.parsed(payload, key, lambda: parse_rss(payload, site, self.days, self.tzinfo))
+        key = ("dwml", site.name, self.days, str(self.tzinfo), self.source_name)
+        return self.cache.parsed(
+            payload, key, lambda: parse_dwml(payload, site, self.days, self.tzinfo, self.source_name)
+        )
@@ -23,7 +23,7 @@ class SourceDailyRecord:
     ice_inches: Optional[float] = None
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class DailyEnsemble:
     site_name: str
     date: date
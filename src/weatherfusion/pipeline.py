@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from .config import AppSettings
 from .ingest.alerts import AlertsClient
-from .ingest.cache import CacheManager
+from .ingest.cache import PARSED_NAMESPACE, CacheManager
 from .ingest.grib import NBMIngestor
 from .ingest.gridpoint import GridpointIngestor
 from .ingest.ndfd import NdfdIngestor
@@ -18,7 +19,6 @@ from .report.csv import write_home_csv, write_work_csv
 from .report.html import render_report
 from .report.image import render_png
 from .util.emailer import EmailClient
-from .util.http import create_session
 from .util.logging import setup_logging
 
 LOGGER = logging.getLogger(__name__)
@@ -40,22 +40,49 @@ def _ingestor_order(
     else:
         order.append(rss)
         order.extend(base_public)
-    dedup: List = []
-    seen = set()
-    for ingestor in order:
-        if ingestor not in seen:
-            dedup.append(ingestor)
-            seen.add(ingestor)
-    return dedup
+    return list(dict.fromkeys(order))
+
+
+def _source_summary(entries_by_site: Dict[str, List[str]], sep: str) -> Tuple[Dict[str, str], str]:
+    """Per-site joined text and the one-line ``site: text | ...`` display form, built in a single pass."""
+    by_site: Dict[str, str] = {}
+    parts: List[str] = []
+    for site_name, entries in entries_by_site.items():
+        text = sep.join(entries) or "—"
+        by_site[site_name] = text
+        parts.append(f"{site_name}: {text}")
+    return by_site, " | ".join(parts)
+
+
+def _fetch_sites(ingestor, site_map: Dict[str, object]) -> List[Tuple[str, List | None, Exception | None]]:
+    """Run one ingestor over ``site_map``, capturing failures so each site is reported separately."""
+    outcomes: List[Tuple[str, List | None, Exception | None]] = []
+    if hasattr(ingestor, "fetch_many"):
+        # Batch-capable ingestors share downloads and sampling across sites in a single call.
+        try:
+            batch = ingestor.fetch_many(site_map.values())
+        except Exception as exc:  # pragma: no cover - network failure path
+            LOGGER.exception("%s ingest failed for %s", ingestor.source_name, ", ".join(site_map))
+            return [(site_name, None, exc) for site_name in site_map]
+        return [(site_name, batch.get(site_name), None) for site_name in site_map]
+    for site_name, site in site_map.items():
+        try:
+            outcomes.append((site_name, ingestor.fetch(site), None))
+        except Exception as exc:  # pragma: no cover - network failure path
+            LOGGER.exception("%s ingest failed for %s", ingestor.source_name, site_name)
+            outcomes.append((site_name, None, exc))
+    return outcomes
 
 
 def run_pipeline(settings: AppSettings) -> RunSummary:
     setup_logging(settings.logs_dir)
-    session = create_session(settings.user_agent)
+    session = settings.session
     cache_root = Path(".cache")
     cache = CacheManager(cache_root, 0 if settings.no_cache else settings.cache_ttl_hours)
+    # parsed/ is content-addressed, so nothing overwrites old entries; sweep it once before the ingest threads start.
+    cache.prune_stale(PARSED_NAMESPACE)
 
-    nbm = NBMIngestor(session, cache, settings.days, settings.tzinfo)
+    nbm = NBMIngestor(session, cache, settings.days, settings.tzinfo, sites=(settings.home, settings.work))
     grid = GridpointIngestor(session, cache, settings.days, settings.tzinfo)
     ndfd = NdfdIngestor(settings, session, cache)
     rss = RSSIngestor(settings, session, cache)
@@ -70,19 +97,30 @@ def run_pipeline(settings: AppSettings) -> RunSummary:
     sources_ok: Dict[str, List[str]] = {settings.home.name: [], settings.work.name: []}
     sources_failed: Dict[str, List[str]] = {settings.home.name: [], settings.work.name: []}
 
-    for ingestor in _ingestor_order(settings, nbm, grid, ndfd, rss):
-        for site_name, site in site_map.items():
-            try:
-                site_data = ingestor.fetch(site)
-                if site_data:
+    # Alerts and every (ingestor, site) fetch are independent I/O, so they all share one pool. Batch-capable
+    # ingestors get a single task covering every site. Results are merged here, in ingestor then site order,
+    # so the ensemble sees the same sequence as a serial run and no locking is needed.
+    ingestors = _ingestor_order(settings, nbm, grid, ndfd, rss)
+    tasks = [
+        (ingestor, [site_map] if hasattr(ingestor, "fetch_many") else [{name: site} for name, site in site_map.items()])
+        for ingestor in ingestors
+    ]
+    workers = len(site_map) + sum(len(groups) for _ingestor, groups in tasks)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ingest") as pool:
+        alert_futures = {site_name: pool.submit(alerts_client.fetch, site) for site_name, site in site_map.items()}
+        ingest_futures = [
+            (ingestor, [pool.submit(_fetch_sites, ingestor, group) for group in groups]) for ingestor, groups in tasks
+        ]
+        for ingestor, futures in ingest_futures:
+            for site_name, site_data, exc in (outcome for future in futures for outcome in future.result()):
+                if exc is not None:
+                    sources_failed[site_name].append(f"{ingestor.source_name}: {exc}")
+                elif site_data:
                     records[site_name].extend(site_data)
                     if ingestor.source_name not in sources_ok[site_name]:
                         sources_ok[site_name].append(ingestor.source_name)
                 else:
                     sources_failed[site_name].append(f"{ingestor.source_name}: no data")
-            except Exception as exc:  # pragma: no cover - network failure path
-                LOGGER.exception("%s ingest failed for %s", ingestor.source_name, site_name)
-                sources_failed[site_name].append(f"{ingestor.source_name}: {exc}")
 
     # Filter out any records older than the run date in the configured timezone
     run_date = datetime.now(settings.tzinfo).date()
@@ -106,9 +144,9 @@ def run_pipeline(settings: AppSettings) -> RunSummary:
     home_rows = build_site_ensembles(settings.home.name, records[settings.home.name], settings.days)
     work_rows = build_site_ensembles(settings.work.name, records[settings.work.name], settings.days)
     site_alerts: Dict[str, List] = {}
-    for site_name, site in site_map.items():
+    for site_name, future in alert_futures.items():
         try:
-            site_alerts[site_name] = alerts_client.fetch(site)
+            site_alerts[site_name] = future.result()
         except Exception as exc:  # pragma: no cover - advisory fetch best effort
             LOGGER.warning("Alert fetch failed for %s: %s", site_name, exc)
             site_alerts[site_name] = []
@@ -121,21 +159,26 @@ def run_pipeline(settings: AppSettings) -> RunSummary:
     work_csv = settings.out_dir / f"work_best_{stamp}.csv"
     settings.out_dir.mkdir(parents=True, exist_ok=True)
 
+    ok_by_site, ok_display = _source_summary(sources_ok, ", ")
+    failed_by_site, failed_display = _source_summary(sources_failed, "; ")
     metadata = {
-        "sources_ok": {k: ", ".join(v) or "—" for k, v in sources_ok.items()},
-        "sources_failed": {k: "; ".join(v) or "—" for k, v in sources_failed.items()},
+        "sources_ok": ok_by_site,
+        "sources_failed": failed_by_site,
+        "sources_ok_display": ok_display,
+        "sources_failed_display": failed_display,
     }
-    metadata["sources_ok_display"] = " | ".join(f"{k}: {v}" for k, v in metadata["sources_ok"].items())
-    metadata["sources_failed_display"] = " | ".join(f"{k}: {v}" for k, v in metadata["sources_failed"].items())
 
     html = render_report(generated_at, home_rows, work_rows, metadata, site_alerts)
     html_path.write_text(html, encoding="utf-8")
     png_report = None
-    try:
-        render_png(html, png_path)
-        png_report = str(png_path)
-    except Exception as exc:  # pragma: no cover - rendering optional
-        LOGGER.warning("Unable to render PNG preview: %s", exc)
+    if settings.render_png:
+        try:
+            render_png(html, png_path)
+            png_report = str(png_path)
+        except Exception as exc:  # pragma: no cover - rendering optional
+            LOGGER.warning("Unable to render PNG preview: %s", exc)
+    else:
+        LOGGER.debug("Skipping PNG preview; enable with --png or RENDER_PNG=true")
     write_home_csv(home_rows, home_csv)
     write_work_csv(work_rows, work_csv)
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 
 
@@ -61,6 +63,10 @@ HEAT_BANDS = [
     ),
 ]
 
+# Ascending view for bisect; HEAT_BANDS itself stays hottest-first
+_BANDS_ASCENDING = sorted(HEAT_BANDS, key=lambda band: band.threshold_f)
+_THRESHOLDS = [band.threshold_f for band in _BANDS_ASCENDING]
+
 DEFAULT_HEAT_GUIDANCE = {
     "continuous_heavy_work_min": "Normal",
     "hydration_cups_per_min": "Baseline",
@@ -70,13 +76,17 @@ DEFAULT_HEAT_GUIDANCE = {
 }
 
 
+# Ensemble temperatures are rounded to 0.1°F, so a run only ever sees a handful of distinct inputs
+@lru_cache(maxsize=1024)
 def classify_heat(high_f: Optional[float]) -> Tuple[Optional[str], Dict[str, str]]:
     if high_f is None:
         return None, DEFAULT_HEAT_GUIDANCE
-    for band in HEAT_BANDS:
-        if high_f >= band.threshold_f:
-            return band.name, band.guidance
-    return None, DEFAULT_HEAT_GUIDANCE
+    idx = bisect_right(_THRESHOLDS, high_f) - 1
+    # The comparison also rejects NaN, which bisect would otherwise place above every threshold
+    if idx < 0 or not high_f >= _THRESHOLDS[idx]:
+        return None, DEFAULT_HEAT_GUIDANCE
+    band = _BANDS_ASCENDING[idx]
+    return band.name, band.guidance
 
 
 FREEZE_GUIDANCE = {
@@ -87,6 +97,7 @@ FREEZE_GUIDANCE = {
 }
 
 
+@lru_cache(maxsize=1024)
 def classify_freeze(low_f: Optional[float], breezy: bool) -> Tuple[Optional[str], Optional[str]]:
     if low_f is None:
         return None, None
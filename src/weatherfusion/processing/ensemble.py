@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from collections import Counter, defaultdict
+import re
+from collections import Counter
+from itertools import groupby
+from operator import attrgetter
 from statistics import mean
 from typing import Iterable, List
 
@@ -21,6 +24,9 @@ PRECIP_PRIORITY = [
     "Drizzle",
     "Thunderstorms",
 ]
+_PRECIP_RANK = {label: rank for rank, label in enumerate(PRECIP_PRIORITY)}
+_UNRANKED = len(PRECIP_PRIORITY)
+_WIND_RE = re.compile(r"breezy|wind|gust", re.IGNORECASE)
 
 
 def _sanitize(value: float | None, key: str) -> float | None:
@@ -32,42 +38,36 @@ def _sanitize(value: float | None, key: str) -> float | None:
     return value
 
 
-def _mean(values: Iterable[float | None]) -> float | None:
-    filtered = [v for v in values if v is not None]
-    if not filtered:
+def _mean(values: Iterable[float | None], digits: int = 1) -> float | None:
+    present = [value for value in values if value is not None]
+    if not present:
         return None
-    return round(mean(filtered), 1)
+    return round(mean(present), digits)
 
 
-def _dominant_precip(types: Iterable[str | None]) -> str | None:
-    filtered = [t for t in types if t]
-    if not filtered:
+def _dominant_precip(votes: Counter[str]) -> str | None:
+    # Highest-priority label wins; unranked labels fall back to the most votes (first seen on ties).
+    if not votes:
         return None
-    counter = Counter(filtered)
-    for label in PRECIP_PRIORITY:
-        if label in counter:
-            return label
-    return counter.most_common(1)[0][0]
+    return min(votes, key=lambda label: (_PRECIP_RANK.get(label, _UNRANKED), -votes[label]))
 
 
 def build_site_ensembles(site_name: str, records: List[SourceDailyRecord], days: int) -> List[DailyEnsemble]:
-    grouped = defaultdict(list)
-    for record in records:
-        grouped[record.date].append(record)
+    # Ingestors emit rows in date order, so the stable sort is a linear pass that keeps each day's source order.
+    by_date = attrgetter("date")
     output: List[DailyEnsemble] = []
-    for day in sorted(grouped.keys()):
-        bucket = grouped[day]
-        highs = [_sanitize(rec.high_f, "high") for rec in bucket]
-        lows = [_sanitize(rec.low_f, "low") for rec in bucket]
-        high = _mean(highs)
-        low = _mean(lows)
+    for day, group in groupby(sorted(records, key=by_date), key=by_date):
+        bucket = list(group)
+        high = _mean(_sanitize(rec.high_f, "high") for rec in bucket)
+        low = _mean(_sanitize(rec.low_f, "low") for rec in bucket)
         if high is not None and low is not None and low > high:
             low = None
+        pop_values = [rec.pop_pct for rec in bucket if rec.pop_pct is not None]
         # Only skip if literally every useful value is missing
         if (
             high is None
             and low is None
-            and all(rec.pop_pct is None for rec in bucket)
+            and not pop_values
             and all(rec.precip_type is None for rec in bucket)
             and all(not rec.precip_notes for rec in bucket)
             and all(rec.qpf_inches in (None, 0) for rec in bucket)
@@ -75,29 +75,19 @@ def build_site_ensembles(site_name: str, records: List[SourceDailyRecord], days:
             and all(rec.ice_inches in (None, 0) for rec in bucket)
         ):
             continue
-        pop_values = [rec.pop_pct for rec in bucket if rec.pop_pct is not None]
         pop_pct = round(max(pop_values), 1) if pop_values else None
-        precip_type = _dominant_precip([rec.precip_type for rec in bucket])
+        precip_votes = Counter(filter(None, [rec.precip_type for rec in bucket]))
+        precip_type = _dominant_precip(precip_votes)
         precip_notes = " | ".join(
             dict.fromkeys(filter(None, [rec.precip_notes for rec in bucket]))
         )
-        qpf_values = [rec.qpf_inches for rec in bucket if rec.qpf_inches is not None]
-        snow_values = [rec.snow_inches for rec in bucket if rec.snow_inches is not None]
-        ice_values = [rec.ice_inches for rec in bucket if rec.ice_inches is not None]
-        qpf_inches = round(mean(qpf_values), 2) if qpf_values else None
-        snow_inches = round(mean(snow_values), 2) if snow_values else None
-        ice_inches = round(mean(ice_values), 2) if ice_values else None
-        breezy = any(
-            (
-                (rec.wind_phrase and any(token in rec.wind_phrase.lower() for token in ("breezy", "wind", "gust")))
-                or (rec.notes and any(token in rec.notes.lower() for token in ("breezy", "wind", "gust")))
-            )
-            for rec in bucket
-        )
+        qpf_inches = _mean((rec.qpf_inches for rec in bucket), 2)
+        snow_inches = _mean((rec.snow_inches for rec in bucket), 2)
+        ice_inches = _mean((rec.ice_inches for rec in bucket), 2)
+        breezy = any(_WIND_RE.search(text) for rec in bucket for text in (rec.wind_phrase, rec.notes) if text)
         heat_category, heat_guidance = classify_heat(high)
         freeze_badge, freeze_guidance = classify_freeze(low, breezy)
         sources = sorted({rec.source for rec in bucket})
-        precip_votes = Counter(filter(None, [rec.precip_type for rec in bucket]))
         precip_consensus = None
         if precip_votes:
             leader, count = precip_votes.most_common(1)[0]
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
+import csv
 from pathlib import Path
-from typing import List
-
-import pandas as pd
+from typing import Iterable, List
 
 from ..models import DailyEnsemble
 
@@ -28,6 +27,7 @@ COMMON_COLUMNS = [
     "radio_checkins",
     "sources_count",
 ]
+WORK_COLUMNS = COMMON_COLUMNS + ["freeze_risk_badge", "freeze_guidance"]
 
 
 def _row_payload(row: DailyEnsemble) -> dict:
@@ -53,26 +53,26 @@ def _row_payload(row: DailyEnsemble) -> dict:
     }
 
 
-def write_home_csv(rows: List[DailyEnsemble], path: Path) -> Path:
+def _write_rows(path: Path, columns: List[str], payloads: Iterable[dict]) -> Path:
     path.parent.mkdir(parents=True, exist_ok=True)
-    df = pd.DataFrame([_row_payload(row) for row in rows], columns=COMMON_COLUMNS)
-    df.to_csv(path, index=False)
+    # "\n" terminators and None -> "" match the files pandas used to write
+    with path.open("w", newline="", encoding="utf-8") as fh:
+        writer = csv.DictWriter(fh, fieldnames=columns, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(payloads)
     return path
 
 
+def write_home_csv(rows: List[DailyEnsemble], path: Path) -> Path:
+    return _write_rows(path, COMMON_COLUMNS, (_row_payload(row) for row in rows))
+
+
+def _work_payload(row: DailyEnsemble) -> dict:
+    payload = _row_payload(row)
+    payload["freeze_risk_badge"] = row.freeze_risk_badge or ""
+    payload["freeze_guidance"] = row.freeze_guidance or ""
+    return payload
+
+
 def write_work_csv(rows: List[DailyEnsemble], path: Path) -> Path:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    records = []
-    for row in rows:
-        payload = _row_payload(row)
-        payload.update(
-            {
-                "freeze_risk_badge": row.freeze_risk_badge or "",
-                "freeze_guidance": row.freeze_guidance or "",
-            }
-        )
-        records.append(payload)
-    columns = COMMON_COLUMNS + ["freeze_risk_badge", "freeze_guidance"]
-    df = pd.DataFrame(records, columns=columns)
-    df.to_csv(path, index=False)
-    return path
+    return _write_rows(path, WORK_COLUMNS, (_work_payload(row) for row in rows))
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Sequence
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+import numpy as np
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
 
 from ..models import DailyEnsemble
 
@@ -20,21 +22,19 @@ class Sparkline:
 
 
 def _sparkline(values: Sequence[float | None], width: int = 240, height: int = 56) -> Sparkline:
-    points = [v for v in values if v is not None]
-    if len(points) < 2:
+    series = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+    present = ~np.isnan(series)
+    points = series[present]
+    if points.size < 2:
         return Sparkline("", None, None)
-    min_v = min(points)
-    max_v = max(points)
+    min_v = float(points.min())
+    max_v = float(points.max())
     span = max(max_v - min_v, 1e-3)
-    step = width / (len(values) - 1)
-    cmds: List[str] = []
-    for idx, value in enumerate(values):
-        if value is None:
-            continue
-        x = round(idx * step, 1)
-        y = round(height - ((value - min_v) / span) * height, 1)
-        cmd = "M" if not cmds else "L"
-        cmds.append(f"{cmd}{x},{y}")
+    step = width / (len(series) - 1)
+    xs = np.round(np.flatnonzero(present) * step, 1).tolist()
+    ys = np.round(height - ((points - min_v) / span) * height, 1).tolist()
+    cmds = [f"L{x},{y}" for x, y in zip(xs, ys)]
+    cmds[0] = "M" + cmds[0][1:]
     return Sparkline(" ".join(cmds), round(min_v, 1), round(max_v, 1))
 
 
@@ -54,11 +54,18 @@ def _format_amount(value: float | None) -> str:
     return f"{value:.2f}\""
 
 
+@lru_cache(maxsize=1)
 def _env() -> Environment:
     loader = FileSystemLoader(TEMPLATE_DIR)
     return Environment(loader=loader, autoescape=select_autoescape(["html", "xml"]))
 
 
+@lru_cache(maxsize=1)
+def _template() -> Template:
+    # Compiled once per process; Template.render is safe to call from several threads.
+    return _env().get_template("report.html.j2")
+
+
 def render_report(
     generated_at: datetime,
     home_rows: List[DailyEnsemble],
@@ -66,8 +73,6 @@ def render_report(
     metadata: dict,
     alerts: Dict[str, List],
 ) -> str:
-    env = _env()
-    template = env.get_template("report.html.j2")
     context = {
         "generated_at": generated_at,
         "home": {
@@ -88,4 +93,4 @@ def render_report(
         "format_pop": _format_pop,
         "format_amount": _format_amount,
     }
-    return template.render(**context)
+    return _template().render(**context)
@@ -3,15 +3,13 @@ from __future__ import annotations
 from io import BytesIO
 from pathlib import Path
 
-import pypdfium2 as pdfium
-from weasyprint import CSS, HTML  # type: ignore[import]
-
 DEFAULT_WIDTH = 960
 
 
-def render_png(html: str, output_path: Path, width_px: int = DEFAULT_WIDTH) -> None:
-    """Render the HTML forecast into a PNG tuned for a half-slide slot."""
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+def render_pdf(html: str, width_px: int = DEFAULT_WIDTH) -> bytes:
+    """HTML forecast laid out as a PDF ``width_px`` wide."""
+    from weasyprint import CSS, HTML  # type: ignore[import]
+
     css = CSS(
         string=f"""
         @page {{
@@ -26,7 +24,14 @@ def render_png(html: str, output_path: Path, width_px: int = DEFAULT_WIDTH) -> N
         }}
         """
     )
-    pdf_bytes = HTML(string=html).write_pdf(stylesheets=[css])
+    return HTML(string=html).write_pdf(stylesheets=[css])
+
+
+def render_png_from_pdf(pdf_bytes: bytes, output_path: Path, width_px: int = DEFAULT_WIDTH) -> None:
+    """Rasterize the first page of ``pdf_bytes`` to a PNG ``width_px`` wide."""
+    import pypdfium2 as pdfium
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
     pdf = pdfium.PdfDocument(BytesIO(pdf_bytes))
     try:
         page = pdf[0]
@@ -43,3 +48,9 @@ def render_png(html: str, output_path: Path, width_px: int = DEFAULT_WIDTH) -> N
             page.close()
     finally:
         pdf.close()
+
+
+def render_png(html: str, output_path: Path, width_px: int = DEFAULT_WIDTH) -> None:
+    """Render the HTML forecast into a PNG tuned for a half-slide slot."""
+    render_png_from_pdf(render_pdf(html, width_px), output_path, width_px)
+
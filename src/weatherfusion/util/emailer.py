@@ -2,15 +2,32 @@ from __future__ import annotations
 
 import logging
 import smtplib
+from concurrent.futures import Future, ThreadPoolExecutor
 from email.message import EmailMessage
 from pathlib import Path
 from typing import Iterable, Mapping
 
-from ..config import AppSettings
+from ..config import AppSettings, EmailSettings
 
 LOGGER = logging.getLogger(__name__)
 
 
+def _connect(email_cfg: EmailSettings) -> smtplib.SMTP:
+    smtp = smtplib.SMTP(email_cfg.host, email_cfg.port)
+    try:
+        smtp.starttls()
+        smtp.login(email_cfg.username, email_cfg.password)
+    except BaseException:
+        smtp.close()
+        raise
+    return smtp
+
+
+def _close_connection(connection: "Future[smtplib.SMTP]") -> None:
+    if connection.exception() is None:
+        connection.result().close()
+
+
 class EmailClient:
     def __init__(self, settings: AppSettings) -> None:
         self.settings = settings
@@ -21,6 +38,21 @@ class EmailClient:
             LOGGER.info("Email disabled; skipping send")
             return False
 
+        # The STARTTLS/LOGIN round trips run in the background while the message and attachments are assembled.
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="smtp") as pool:
+            connection = pool.submit(_connect, email_cfg)
+            try:
+                msg = self._build_message(subject, html_body, attachments)
+            except BaseException:
+                connection.add_done_callback(_close_connection)
+                raise
+            with connection.result() as smtp:
+                smtp.send_message(msg)
+        LOGGER.info("Email delivered to %s", email_cfg.recipient)
+        return True
+
+    def _build_message(self, subject: str, html_body: str, attachments: Mapping[str, Path]) -> EmailMessage:
+        email_cfg = self.settings.email
         msg = EmailMessage()
         msg["Subject"] = subject
         msg["From"] = email_cfg.sender
@@ -37,10 +69,4 @@ class EmailClient:
                 subtype="csv" if path.suffix == ".csv" else "html",
                 filename=path.name,
             )
-
-        with smtplib.SMTP(email_cfg.host, email_cfg.port) as smtp:
-            smtp.starttls()
-            smtp.login(email_cfg.username, email_cfg.password)
-            smtp.send_message(msg)
-        LOGGER.info("Email delivered to %s", email_cfg.recipient)
-        return True
+        return msg
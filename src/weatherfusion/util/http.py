@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Iterable
 
 import requests
@@ -8,6 +9,9 @@ from urllib3.util.retry import Retry
 
 
 DEFAULT_TIMEOUT = 30
+# Keep-alive connections per host: enough for NBM prefetch workers x parallel sub-range GETs (12 x 4)
+# plus the concurrently running ingestors, so no request waits on or discards a pooled socket.
+DEFAULT_POOL_SIZE = 64
 
 
 class TimeoutHTTPAdapter(HTTPAdapter):
@@ -20,7 +24,13 @@ class TimeoutHTTPAdapter(HTTPAdapter):
         return super().send(request, **kwargs)
 
 
-def create_session(user_agent: str, retries: int = 3, backoff: float = 0.3, status_forcelist: Iterable[int] = (500, 502, 503, 504)) -> requests.Session:
+def create_session(
+    user_agent: str,
+    retries: int = 3,
+    backoff: float = 0.2,
+    status_forcelist: Iterable[int] = (429, 500, 502, 503, 504),
+    pool_size: int = DEFAULT_POOL_SIZE,
+) -> requests.Session:
     session = requests.Session()
     session.headers.update({"User-Agent": user_agent})
     retry = Retry(
@@ -32,7 +42,13 @@ def create_session(user_agent: str, retries: int = 3, backoff: float = 0.3, stat
         allowed_methods=("GET", "HEAD"),
         raise_on_status=False,
     )
-    adapter = TimeoutHTTPAdapter(max_retries=retry)
+    adapter = TimeoutHTTPAdapter(max_retries=retry, pool_connections=pool_size, pool_maxsize=pool_size)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     return session
+
+
+@lru_cache(maxsize=8)
+def get_shared_session(user_agent: str) -> requests.Session:
+    """Process-wide session per user agent, so repeated runs in one process reuse warm keep-alive connections."""
+    return create_session(user_agent)
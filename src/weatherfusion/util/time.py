@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 NY_TZ = ZoneInfo("America/New_York")
@@ -21,6 +22,7 @@ def local_date_from_midpoint(start: datetime, end: datetime, tz: ZoneInfo = NY_T
     return to_local(midpoint, tz).date()
 
 
+@lru_cache(maxsize=512)
 def format_day_label(day: datetime.date) -> str:
     return day.strftime("%a %b %d")
 
@@ -0,0 +1,118 @@
+import os
+import time
+
+from weatherfusion.ingest import cache as cache_module
+from weatherfusion.ingest.cache import CacheManager, DownloadResult
+
+
+def _age(path, hours: float) -> None:
+    stamp = time.time() - hours * 3600
+    os.utime(path, (stamp, stamp))
+
+
+def test_fetch_conditional_revalidates_with_stored_validators(tmp_path):
+    cache = CacheManager(tmp_path, ttl_hours=1)
+    seen = []
+
+    def downloader(headers):
+        seen.append(headers)
+        if headers:
+            return DownloadResult(content=None)
+        return DownloadResult(content=b"payload", etag='"v1"', last_modified="Wed, 01 May 2024 00:00:00 GMT")
+
+    first = cache.fetch_conditional("feeds", "home.xml", downloader)
+    assert first.fresh is False
+    assert first.path.read_bytes() == b"payload"
+
+    assert cache.fetch_conditional("feeds", "home.xml", downloader).fresh is True
+    assert len(seen) == 1  # still within the TTL, so no request at all
+
+    _age(first.path, 2)
+    revalidated = cache.fetch_conditional("feeds", "home.xml", downloader)
+    assert seen[-1] == {"If-None-Match": '"v1"', "If-Modified-Since": "Wed, 01 May 2024 00:00:00 GMT"}
+    assert revalidated.fresh is True
+    assert revalidated.path.read_bytes() == b"payload"
+    assert cache.fetch_conditional("feeds", "home.xml", downloader).fresh is True
+    assert len(seen) == 2  # the 304 restarted the TTL
+
+
+def test_drop_validators_forces_unconditional_refetch(tmp_path):
+    cache = CacheManager(tmp_path, ttl_hours=1)
+    seen = []
+
+    def downloader(headers):
+        seen.append(headers)
+        return DownloadResult(content=b"v%d" % len(seen), etag=f'"v{len(seen)}"')
+
+    cached = cache.fetch_conditional("feeds", "home.xml", downloader)
+    cache.drop_validators(cached.path)
+    _age(cached.path, 2)
+    refreshed = cache.fetch_conditional("feeds", "home.xml", downloader)
+    assert seen == [{}, {}]
+    assert refreshed.path.read_bytes() == b"v2"
+
+
+def test_parsed_reuses_results_in_memory_and_on_disk(tmp_path):
+    calls = []
+
+    def parse():
+        calls.append(1)
+        return {"rows": [1, 2, 3]}
+
+    cache = CacheManager(tmp_path, ttl_hours=1)
+    first = cache.parsed(b"<dwml/>", ("dwml", "Home"), parse)
+    second = cache.parsed(b"<dwml/>", ("dwml", "Home"), parse)
+    assert first == second == {"rows": [1, 2, 3]}
+    assert first is not second  # each caller gets its own objects
+    assert len(calls) == 1
+
+    # A new manager over the same root picks the pickle up from parsed/
+    assert CacheManager(tmp_path, ttl_hours=1).parsed(b"<dwml/>", ("dwml", "Home"), parse) == first
+    assert len(calls) == 1
+
+    cache.parsed(b"<dwml/>", ("dwml", "Work"), parse)
+    cache.parsed(b"<dwml />", ("dwml", "Home"), parse)
+    assert len(calls) == 3  # key and content both feed the digest
+
+
+def test_parsed_format_version_bump_invalidates_entries(tmp_path, monkeypatch):
+    calls = []
+
+    def parse():
+        calls.append(1)
+        return len(calls)
+
+    assert CacheManager(tmp_path, ttl_hours=1).parsed(b"<dwml/>", ("dwml",), parse) == 1
+    monkeypatch.setattr(cache_module, "PARSED_FORMAT_VERSION", cache_module.PARSED_FORMAT_VERSION + 1)
+    assert CacheManager(tmp_path, ttl_hours=1).parsed(b"<dwml/>", ("dwml",), parse) == 2
+
+
+def test_parsed_reparses_corrupt_entries_and_honours_zero_ttl(tmp_path):
+    calls = []
+
+    def parse():
+        calls.append(1)
+        return len(calls)
+
+    source = tmp_path / "feed.xml"
+    source.write_bytes(b"<rss/>")
+    cache = CacheManager(tmp_path / "cache", ttl_hours=1)
+    assert cache.parsed(source, ("rss",), parse) == 1
+    for entry in (tmp_path / "cache" / "parsed").iterdir():
+        entry.write_bytes(b"not a pickle")
+    assert CacheManager(tmp_path / "cache", ttl_hours=1).parsed(source, ("rss",), parse) == 2
+
+    uncached = CacheManager(tmp_path / "nocache", ttl_hours=0)
+    assert uncached.parsed(source, ("rss",), parse) == 3
+    assert uncached.parsed(source, ("rss",), parse) == 4
+
+
+def test_prune_stale_removes_only_expired_entries(tmp_path):
+    cache = CacheManager(tmp_path, ttl_hours=1)
+    cache.prune_stale("reports")  # missing namespace is a no-op
+    old = cache.store("reports", "old.html", b"old").path
+    new = cache.store("reports", "new.html", b"new").path
+    _age(old, 2)
+    cache.prune_stale("reports")
+    assert not old.exists()
+    assert new.exists()
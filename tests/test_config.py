@@ -0,0 +1,90 @@
+import json
+
+import pytest
+
+from weatherfusion import config
+
+ZIPCITY_PAGE = '<html><body><a href="https://forecast.weather.gov/MapClick.php?lat=39.3612&lon=-78.0411">7-day</a></body></html>'
+
+
+class FakeResponse:
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class FakeSession:
+    def __init__(self, text: str = ZIPCITY_PAGE) -> None:
+        self.text = text
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None):
+        self.calls.append(params)
+        return FakeResponse(self.text)
+
+
+def test_geocode_cache_hits_for_equivalent_addresses(tmp_path):
+    session = FakeSession()
+    first = config._resolve_work_coords("1042 Development Drive, Inwood, WV", tmp_path, session)
+    again = config._resolve_work_coords("  1042 development drive   INWOOD wv. ", tmp_path, session)
+    assert first == again == (39.3612, -78.0411)
+    assert len(session.calls) == 1
+    cached = json.loads((tmp_path / config.GEOCODE_CACHE_NAME).read_text())
+    assert list(cached) == ["1042 development drive inwood wv"]
+
+
+def test_geocode_cache_write_is_atomic(tmp_path, monkeypatch):
+    path = tmp_path / config.GEOCODE_CACHE_NAME
+    config._write_cached_coords(path, "Home", 39.0, -77.0)
+    before = path.read_text()
+
+    def failing_dump(obj, fh, **kwargs):
+        fh.write('{"partial": ')
+        raise OSError("disk full")
+
+    monkeypatch.setattr(config.json, "dump", failing_dump)
+    with pytest.raises(OSError):
+        config._write_cached_coords(path, "Work", 39.5, -78.0)
+    assert path.read_text() == before
+    assert [entry.name for entry in tmp_path.iterdir()] == [config.GEOCODE_CACHE_NAME]  # temp file cleaned up
+
+
+@pytest.mark.parametrize("contents", [None, "{not json", "[1, 2]", '{"1042 development drive inwood wv": {"lat": "x"}}'])
+def test_unusable_geocode_cache_falls_back_to_live_lookup(tmp_path, contents):
+    path = tmp_path / config.GEOCODE_CACHE_NAME
+    if contents is not None:
+        path.write_text(contents)
+    session = FakeSession()
+    assert config._resolve_work_coords("1042 Development Drive, Inwood, WV", tmp_path, session) == (39.3612, -78.0411)
+    assert len(session.calls) == 1
+    assert json.loads(path.read_text())["1042 development drive inwood wv"]["lat"] == 39.3612
+
+
+@pytest.mark.parametrize(
+    "page",
+    [
+        '<a href="https://forecast.weather.gov/MapClick.php?lat=39.3612&amp;lon=-78.0411">7-day</a>',
+        "<a class='fc' href='MapClick.php?lat=39.3612&amp;lon=-78.0411&amp;site=LWX'>7-day</a>",
+        '<A HREF = "MapClick.php?lon=-78.0411&lat=39.3612">7-day</A>',
+        '<a href="MapClick.php?site=LWX">radar</a> <a href="MapClick.php?lat=39.3612&amp;lon=-78.0411">7-day</a>',
+    ],
+)
+def test_mapclick_href_is_found_and_unescaped(tmp_path, page):
+    assert config._resolve_work_coords("Inwood, WV", tmp_path, FakeSession(page)) == (39.3612, -78.0411)
+
+
+def test_page_without_mapclick_link_is_an_error(tmp_path):
+    page = '<a href="https://forecast.weather.gov/zipcity.php?lat=39.3612&amp;lon=-78.0411">search</a>'
+    with pytest.raises(RuntimeError):
+        config._resolve_work_coords("Inwood, WV", tmp_path, FakeSession(page))
+    assert not (tmp_path / config.GEOCODE_CACHE_NAME).exists()
+
+
+def test_work_coordinate_overrides_skip_the_geocode_cache(tmp_path):
+    settings = config.load_settings(
+        {"out_dir": str(tmp_path / "out"), "logs_dir": str(tmp_path / "logs"), "work_lat": "39.5", "work_lon": "-78.1"}
+    )
+    assert (settings.work.latitude, settings.work.longitude) == (39.5, -78.1)
+    assert not (tmp_path / "out" / config.GEOCODE_CACHE_NAME).exists()
@@ -0,0 +1,59 @@
+from datetime import date
+
+import pytest
+
+from weatherfusion.models import SourceDailyRecord
+from weatherfusion.processing.ensemble import build_site_ensembles
+from weatherfusion.report.csv import COMMON_COLUMNS, WORK_COLUMNS, write_home_csv, write_work_csv
+
+
+def make_rows():
+    recs = [
+        SourceDailyRecord(
+            site_name="Work",
+            date=date(2024, 5, 1),
+            label="Wed May 01",
+            source="nbm_grib",
+            high_f=92.4,
+            low_f=70.0,
+            pop_pct=40.0,
+            precip_type="Thunderstorms",
+            precip_notes='NBM QPF 0.25"; storms, "gusty"',
+            qpf_inches=0.25,
+        ),
+        SourceDailyRecord(site_name="Work", date=date(2024, 5, 1), label="Wed May 01", source="nws_rss", high_f=95.0),
+        SourceDailyRecord(
+            site_name="Work",
+            date=date(2024, 5, 2),
+            label="Thu May 02",
+            source="nws_rss",
+            low_f=27.0,
+            precip_type="Snow",
+            snow_inches=1.5,
+            wind_phrase="Breezy",
+        ),
+    ]
+    return build_site_ensembles("Work", recs, days=2)
+
+
+def test_write_home_csv_format(tmp_path):
+    path = write_home_csv(make_rows(), tmp_path / "home.csv")
+    lines = path.read_bytes().split(b"\n")
+    assert lines[0] == ",".join(COMMON_COLUMNS).encode()
+    assert lines[1].startswith(b'2024-05-01,Wed May 01,93.7,70.0,40.0,Thunderstorms,"NBM QPF 0.25""; storms, ""gusty""",0.25,,,')
+    assert lines[2].startswith(b"2024-05-02,Thu May 02,,27.0,,Snow,,,1.5,,Snow (1/1 sources typed),")
+    assert lines[-1] == b""  # trailing "\n", no "\r\n"
+
+
+def test_csv_output_matches_pandas_bytes(tmp_path):
+    pd = pytest.importorskip("pandas")
+    from weatherfusion.report.csv import _row_payload, _work_payload
+
+    rows = make_rows()
+    home = write_home_csv(rows, tmp_path / "home.csv")
+    work = write_work_csv(rows, tmp_path / "work.csv")
+
+    pd.DataFrame([_row_payload(row) for row in rows], columns=COMMON_COLUMNS).to_csv(tmp_path / "home_pd.csv", index=False)
+    pd.DataFrame([_work_payload(row) for row in rows], columns=WORK_COLUMNS).to_csv(tmp_path / "work_pd.csv", index=False)
+    assert home.read_bytes() == (tmp_path / "home_pd.csv").read_bytes()
+    assert work.read_bytes() == (tmp_path / "work_pd.csv").read_bytes()
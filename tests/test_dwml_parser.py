@@ -1,7 +1,10 @@
+from pathlib import Path
 from zoneinfo import ZoneInfo
 
 from weatherfusion.config import SiteSettings
-from weatherfusion.ingest.dwml import parse_dwml
+from weatherfusion.ingest.dwml import parse_dwml, parse_dwml_path
+
+DWML_SAMPLE = Path(__file__).parent / "fixtures" / "dwml_sample.xml"
 
 
 def test_parse_dwml_extracts_daily_fields():
@@ -17,3 +20,10 @@ def test_parse_dwml_extracts_daily_fields():
     assert first.wind_phrase and "breezy" in first.wind_phrase.lower()
     second = rows[1]
     assert second.precip_type.startswith("Chance Light Snow") or "Snow" in (second.precip_type or "")
+
+
+def test_parse_dwml_path_matches_text_parse():
+    site = SiteSettings(name="Home", latitude=39.3, longitude=-77.7)
+    tz = ZoneInfo("America/New_York")
+    from_text = parse_dwml(DWML_SAMPLE.read_text(encoding="utf-8"), site, days=3, tzinfo=tz)
+    assert parse_dwml_path(DWML_SAMPLE, site, days=3, tzinfo=tz) == from_text
@@ -0,0 +1,44 @@
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from weatherfusion.config import EmailSettings
+from weatherfusion.util import emailer
+
+EMAIL = EmailSettings(
+    sender="wx@example.com",
+    recipient="ops@example.com",
+    host="smtp.example.com",
+    port=2525,
+    username="wx",
+    password="secret",
+)
+
+
+def test_send_uses_the_connection_opened_during_assembly(tmp_path):
+    attachment = tmp_path / "home.csv"
+    attachment.write_text("date\n2024-05-01\n")
+    with mock.patch.object(emailer.smtplib, "SMTP") as smtp_cls:
+        smtp = smtp_cls.return_value
+        smtp.__enter__.return_value = smtp
+        assert emailer.EmailClient(SimpleNamespace(email=EMAIL)).send("Forecast", "<p>hi</p>", {"Home": attachment})
+
+    smtp_cls.assert_called_once_with("smtp.example.com", 2525)
+    smtp.starttls.assert_called_once_with()
+    smtp.login.assert_called_once_with("wx", "secret")
+    [msg] = smtp.send_message.call_args.args
+    assert msg["To"] == "ops@example.com"
+    assert [part.get_filename() for part in msg.iter_attachments()] == ["home.csv"]
+    smtp.__exit__.assert_called_once()
+
+
+def test_connection_is_closed_when_message_assembly_fails(tmp_path):
+    with mock.patch.object(emailer.smtplib, "SMTP") as smtp_cls:
+        smtp = smtp_cls.return_value
+        with pytest.raises(FileNotFoundError):
+            emailer.EmailClient(SimpleNamespace(email=EMAIL)).send("Forecast", "<p>hi</p>", {"Home": tmp_path / "missing.csv"})
+
+    smtp.login.assert_called_once_with("wx", "secret")
+    smtp.close.assert_called_once_with()
+    smtp.send_message.assert_not_called()
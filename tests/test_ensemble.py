@@ -1,7 +1,9 @@
-from datetime import date
+import random
+from datetime import date, timedelta
+from statistics import mean
 
 from weatherfusion.models import SourceDailyRecord
-from weatherfusion.processing.ensemble import build_site_ensembles
+from weatherfusion.processing.ensemble import TEMP_LIMITS, build_site_ensembles
 
 
 def make_record(source: str, high: float | None, low: float | None, pop: float | None, precip: str | None, notes: str = ""):
@@ -36,3 +38,59 @@ def test_build_site_ensembles_skips_invalid_rows():
     recs = [make_record("nbm_grib", None, None, None, None)]
     rows = build_site_ensembles("Home", recs, days=1)
     assert rows == []
+
+
+def _expected_mean(values, digits=1, limits=None):
+    kept = [v for v in values if v is not None and (limits is None or limits[0] <= v <= limits[1])]
+    return round(mean(kept), digits) if kept else None
+
+
+def test_build_site_ensembles_matches_statistics_mean():
+    rng = random.Random(20240501)
+
+    def maybe(lo, hi, digits):
+        return None if rng.random() < 0.25 else round(rng.uniform(lo, hi), digits)
+
+    start = date(2024, 5, 1)
+    recs = [
+        SourceDailyRecord(
+            site_name="Home",
+            date=start + timedelta(days=rng.randrange(8)),
+            label="",
+            source=rng.choice(["nbm_grib", "nws_rss", "ndfd", "gridpoint"]),
+            high_f=maybe(-60, 150, 1),  # some beyond TEMP_LIMITS, which must be dropped
+            low_f=maybe(-80, 110, 1),
+            pop_pct=maybe(0, 100, 0),
+            qpf_inches=maybe(0, 2, 2),
+            snow_inches=maybe(0, 6, 1),
+            ice_inches=maybe(0, 1, 2),
+        )
+        for _ in range(300)
+    ]
+    rows = build_site_ensembles("Home", list(reversed(recs)), days=8)
+    assert [row.date for row in rows] == sorted({rec.date for rec in recs})
+    for row in rows:
+        bucket = [rec for rec in recs if rec.date == row.date]
+        high = _expected_mean([rec.high_f for rec in bucket], limits=TEMP_LIMITS["high"])
+        low = _expected_mean([rec.low_f for rec in bucket], limits=TEMP_LIMITS["low"])
+        if high is not None and low is not None and low > high:
+            low = None
+        pops = [rec.pop_pct for rec in bucket if rec.pop_pct is not None]
+        assert row.high_f == high
+        assert row.low_f == low
+        assert row.pop_pct == (round(max(pops), 1) if pops else None)
+        assert row.qpf_inches == _expected_mean([rec.qpf_inches for rec in bucket], 2)
+        assert row.snow_inches == _expected_mean([rec.snow_inches for rec in bucket], 2)
+        assert row.ice_inches == _expected_mean([rec.ice_inches for rec in bucket], 2)
+
+
+def test_build_site_ensembles_skips_empty_days_before_the_cutoff():
+    first, blank, third = date(2024, 5, 1), date(2024, 5, 2), date(2024, 5, 3)
+    recs = [
+        SourceDailyRecord(site_name="Home", date=third, label="", source="ndfd", high_f=70.0),
+        SourceDailyRecord(site_name="Home", date=blank, label="", source="ndfd", qpf_inches=0.0),
+        SourceDailyRecord(site_name="Home", date=first, label="", source="ndfd", high_f=72.0),
+        SourceDailyRecord(site_name="Home", date=date(2024, 5, 4), label="", source="ndfd", high_f=68.0),
+    ]
+    rows = build_site_ensembles("Home", recs, days=2)
+    assert [(row.date, row.high_f) for row in rows] == [(first, 72.0), (third, 70.0)]
@@ -0,0 +1,106 @@
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pytest
+
+from weatherfusion.config import SiteSettings
+from weatherfusion.ingest.cache import CacheManager
+from weatherfusion.ingest.grib import GribIndexEntry, NBMIngestor, crop_to_window, index_spans, parse_index
+
+xr = pytest.importorskip("xarray")
+
+TZ = ZoneInfo("America/New_York")
+SITES = [SiteSettings(name="Home", latitude=39.1, longitude=-78.1), SiteSettings(name="Work", latitude=40.4, longitude=-77.2)]
+
+
+NBM_INDEX = (
+    "1:0:d=2024050100:TMP:2 m above ground:24 hour fcst:\n"
+    "2:1500:d=2024050100:TMP:2 m above ground:24 hour fcst:std dev\n"
+    "3:2600:d=2024050100:TMAX:2 m above ground:12-24 hour max fcst:\r\n"
+    "4:4100:d=2024050100:TMP:2 m above ground:24 hour fcst:prob >305.372\n"
+    "5:5000:d=2024050100:APCP:surface:12-24 hour acc fcst:\n"
+)
+
+
+def test_parse_index_reads_number_offset_and_description():
+    entries = parse_index(NBM_INDEX + "not an index line\n")
+    assert len(entries) == 5
+    assert entries[0] == GribIndexEntry(1, 0, "d=2024050100:TMP:2 m above ground:24 hour fcst:")
+    assert entries[2].description.endswith("max fcst:")  # CRLF stripped
+    assert [entry.offset for entry in entries] == [0, 1500, 2600, 4100, 5000]
+
+
+def test_index_spans_take_first_non_std_dev_message():
+    spans = index_spans(parse_index(NBM_INDEX))
+    assert spans == {
+        "TMP": (0, 1499),
+        "TMAX": (2600, 4099),
+        "APCP": (5000, None),  # last message runs to end of file
+    }
+
+
+def _regular_grid(lon_offset: float = 0.0):
+    lat = np.arange(38.0, 41.01, 0.5)
+    lon = np.arange(-80.0, -76.99, 0.5) + lon_offset
+    values = np.arange(lat.size * lon.size, dtype=float).reshape(lat.size, lon.size)
+    return xr.DataArray(values, dims=("latitude", "longitude"), coords={"latitude": lat, "longitude": lon})
+
+
+def test_extract_values_samples_each_site_at_its_nearest_cell(tmp_path):
+    grid = _regular_grid()
+    values = NBMIngestor(None, CacheManager(tmp_path), 1, TZ)._extract_values(grid, SITES)
+    assert values.tolist() == [
+        grid.sel(latitude=39.0, longitude=-78.0).item(),
+        grid.sel(latitude=40.5, longitude=-77.0).item(),
+    ]
+
+
+def test_extract_values_reuses_cached_cells(tmp_path, monkeypatch):
+    ingestor = NBMIngestor(None, CacheManager(tmp_path), 1, TZ)
+    lookups = []
+    nearest = ingestor._nearest_cell
+    monkeypatch.setattr(ingestor, "_nearest_cell", lambda data, lat, lon: lookups.append((lat, lon)) or nearest(data, lat, lon))
+    grid = _regular_grid()
+    first = ingestor._extract_values(grid, SITES)
+    second = ingestor._extract_values(grid + 1.0, SITES)
+    assert (second - first).tolist() == [1.0, 1.0]
+    assert lookups == [(39.1, -78.1), (40.4, -77.2)]  # one search per site, reused for the next field
+    assert ingestor._extract_values(_regular_grid(lon_offset=360.0), SITES[:1]).tolist() == [first[0]]
+
+
+def test_crop_to_window_regular_grid():
+    cropped = crop_to_window(_regular_grid(), (39.0, 40.0, -78.5, -77.5))
+    assert cropped.coords["latitude"].values.tolist() == [39.0, 39.5, 40.0]
+    assert cropped.coords["longitude"].values.tolist() == [-78.5, -78.0, -77.5]
+
+
+def test_crop_to_window_wraps_0_360_longitudes():
+    cropped = crop_to_window(_regular_grid(lon_offset=360.0), (39.0, 40.0, -78.5, -77.5))
+    assert cropped.coords["longitude"].values.tolist() == [281.5, 282.0, 282.5]
+
+
+def test_crop_to_window_projected_grid_and_empty_match():
+    lat2d, lon2d = np.meshgrid(np.linspace(38.0, 41.0, 7), np.linspace(-80.0, -77.0, 7), indexing="ij")
+    lat2d = lat2d + 0.01 * np.arange(7)  # skewed rows, as on the Lambert grid
+    data = xr.DataArray(
+        np.zeros((7, 7)),
+        dims=("y", "x"),
+        coords={"latitude": (("y", "x"), lat2d), "longitude": (("y", "x"), lon2d)},
+    )
+    cropped = crop_to_window(data, (39.0, 40.0, -78.5, -77.5))
+    inside = (lat2d >= 39.0) & (lat2d <= 40.0) & (lon2d >= -78.5) & (lon2d <= -77.5)
+    assert cropped.shape == (inside.any(axis=1).sum(), inside.any(axis=0).sum())
+    assert crop_to_window(data, (10.0, 11.0, -100.0, -99.0)) is data
+
+
+def test_site_cells_follow_the_crop_window(tmp_path):
+    home = SiteSettings(name="Home", latitude=39.0, longitude=-78.0)
+    ingestor = NBMIngestor(None, CacheManager(tmp_path), 1, TZ, sites=[home])
+    first = _regular_grid().isel(latitude=slice(0, 4), longitude=slice(2, 6))
+    assert ingestor._extract_values(first, [home]).tolist() == [first.sel(latitude=39.0, longitude=-78.0).item()]
+
+    # Growing the window yields a same-shaped crop over different cells; the cached index must not carry over
+    ingestor._cover(SiteSettings(name="Work", latitude=40.5, longitude=-77.0))
+    shifted = _regular_grid().isel(latitude=slice(2, 6), longitude=slice(3, 7))
+    assert shifted.shape == first.shape
+    assert ingestor._extract_values(shifted, [home]).tolist() == [shifted.sel(latitude=39.0, longitude=-78.0).item()]
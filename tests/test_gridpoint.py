@@ -0,0 +1,68 @@
+from datetime import date
+from zoneinfo import ZoneInfo
+
+from weatherfusion.config import SiteSettings
+from weatherfusion.ingest.cache import CacheManager
+from weatherfusion.ingest.gridpoint import GridpointIngestor, c_to_f, mm_to_inches
+
+
+def make_ingestor(tmp_path, days=3):
+    return GridpointIngestor(None, CacheManager(tmp_path), days, ZoneInfo("America/New_York"))
+
+
+def test_bucket_numeric_groups_by_local_start_day(tmp_path):
+    ingestor = make_ingestor(tmp_path)
+    values = [
+        {"validTime": "2024-05-01T14:00:00+00:00/PT6H", "value": 20.0},
+        {"validTime": "2024-05-02T03:00:00+00:00/PT1H", "value": 25.0},  # 23:00 EDT on May 1
+        {"validTime": "2024-05-02T16:00:00Z/PT1H", "value": 18.0},
+        {"validTime": "2024-05-02T17:00:00/PT1H", "value": None},
+        {"validTime": "not-a-time/PT1H", "value": 99.0},
+        {"value": 99.0},
+    ]
+    assert ingestor._bucket_numeric(values, transform=c_to_f) == {date(2024, 5, 1): 77.0, date(2024, 5, 2): 64.4}
+
+
+def test_bucket_numeric_sums_amounts(tmp_path):
+    ingestor = make_ingestor(tmp_path)
+    values = [
+        {"validTime": "2024-05-01T12:00:00+00:00/PT6H", "value": 2.54},
+        {"validTime": "2024-05-01T18:00:00+00:00/PT6H", "value": 5.08},
+        {"validTime": "2024-05-02T12:00:00+00:00/PT6H", "value": 0.0},
+    ]
+    totals = ingestor._bucket_numeric(values, agg="sum", transform=mm_to_inches)
+    assert totals == {date(2024, 5, 1): 0.3, date(2024, 5, 2): 0.0}
+    assert ingestor._bucket_numeric([]) == {}
+
+
+def test_bucket_weather_dedupes_phrases_per_day(tmp_path):
+    ingestor = make_ingestor(tmp_path)
+    rain = {"coverage": "chance", "intensity": "light", "weather": "rain_showers", "attributes": []}
+    values = [
+        {"validTime": "2024-05-01T12:00:00+00:00/PT6H", "value": [rain]},
+        {"validTime": "2024-05-01T18:00:00+00:00/PT6H", "value": [rain, {"weather": "thunderstorms"}]},
+        {"validTime": "2024-05-02T12:00:00+00:00/PT6H", "value": [{"weather": None}]},
+    ]
+    assert ingestor._bucket_weather(values) == {
+        date(2024, 5, 1): ("Chance Light Rain Showers", "Chance Light Rain Showers, Thunderstorms"),
+    }
+
+
+def test_fetch_builds_daily_records(tmp_path, monkeypatch):
+    ingestor = make_ingestor(tmp_path, days=1)
+    props = {
+        "maxTemperature": {"values": [{"validTime": "2024-05-01T14:00:00+00:00/PT6H", "value": 25.0}]},
+        "minTemperature": {"values": [{"validTime": "2024-05-01T09:00:00+00:00/PT6H", "value": 10.0}]},
+        "probabilityOfPrecipitation": {"values": [{"validTime": "2024-05-01T12:00:00+00:00/PT6H", "value": 40}]},
+        "quantitativePrecipitation": {"values": [{"validTime": "2024-05-01T12:00:00+00:00/PT6H", "value": 2.54}]},
+        "weather": {"values": [{"validTime": "2024-05-01T12:00:00+00:00/PT6H", "value": [{"weather": "rain"}]}]},
+        "snowfallAmount": {"values": [{"validTime": "2024-05-02T12:00:00+00:00/PT6H", "value": 10.0}]},
+    }
+    monkeypatch.setattr(ingestor, "_point_metadata", lambda site: {"properties": {"forecastGridData": "grid"}})
+    monkeypatch.setattr(ingestor, "_grid_data", lambda url, site: {"properties": props})
+    site = SiteSettings(name="Home", latitude=39.3, longitude=-77.7)
+    [record] = ingestor.fetch(site)
+    assert record.date == date(2024, 5, 1)
+    assert (record.high_f, record.low_f, record.pop_pct, record.qpf_inches) == (77.0, 50.0, 40.0, 0.1)
+    assert record.precip_type == "Rain"
+    assert record.precip_notes == 'NWS QPF 0.10" | Rain'
@@ -0,0 +1,77 @@
+from datetime import date
+from zoneinfo import ZoneInfo
+
+from weatherfusion.config import SiteSettings
+from weatherfusion.ingest.rss import parse_rss
+
+SITE = SiteSettings(name="Home", latitude=39.3, longitude=-77.7)
+TZ = ZoneInfo("America/New_York")
+
+RSS_FEED = """<?xml version="1.0" encoding="ISO-8859-1"?>
+<rss version="2.0">
+  <channel>
+    <title>Forecast</title>
+    <item>
+      <title>Tonight: Rain Likely. Low: 58 &#176;F</title>
+      <description>Rain likely. Chance of precipitation is 60%. Breezy.</description>
+      <pubDate>Wed, 01 May 2024 22:00:00 -0400</pubDate>
+    </item>
+    <item>
+      <title>Thursday: Sunny. High: 78 &#176;F</title>
+      <description>Sunny, with a high near 78. Chance of precipitation is 10%.</description>
+      <pubDate>Wed, 01 May 2024 16:00:00 -0400</pubDate>
+    </item>
+    <item>
+      <title>Friday: Snow showers. High: 35 &#176;F</title>
+      <description>Snow showers, mainly after noon; notice the wind.</description>
+      <pubDate>Thu, 02 May 2024 14:00:00 +0000</pubDate>
+    </item>
+    <item>
+      <title>Undated</title>
+      <description>High: 99 &#176;F</description>
+    </item>
+  </channel>
+</rss>
+""".encode("latin-1")
+
+ATOM_FEED = """<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Forecast</title>
+  <entry>
+    <title>Today: High: 71 °F</title>
+    <summary>Showers and freezing drizzle late. 30% chance.</summary>
+    <updated>2024-05-01T12:00:00Z</updated>
+  </entry>
+  <entry>
+    <title>Tomorrow: Low: 40 °F</title>
+    <summary>Clear.</summary>
+    <published>2024-05-02T12:00:00-04:00</published>
+  </entry>
+</feed>
+"""
+
+
+def test_parse_rss_reads_rss2_items_into_local_days():
+    rows = parse_rss(RSS_FEED, SITE, days=5, tzinfo=TZ)
+    assert [row.date for row in rows] == [date(2024, 5, 1), date(2024, 5, 2)]
+    first, second = rows
+    assert (first.high_f, first.low_f, first.pop_pct) == (78.0, 58.0, 60.0)
+    assert first.precip_type == "Rain"
+    assert first.wind_phrase and "Breezy" in first.wind_phrase
+    assert second.high_f == 35.0
+    assert second.precip_type == "Snow"  # "notice" must not read as ice
+    assert all(row.source == "nws_rss" for row in rows)
+
+
+def test_parse_rss_reads_atom_entries_and_honours_days():
+    rows = parse_rss(ATOM_FEED, SITE, days=1, tzinfo=TZ)
+    assert len(rows) == 1
+    [today] = rows
+    assert today.date == date(2024, 5, 1)
+    assert (today.high_f, today.pop_pct) == (71.0, 30.0)
+    assert today.precip_type == "Freezing Rain"
+    assert today.precip_notes.startswith("Today: High: 71")
+
+    [tomorrow] = parse_rss(ATOM_FEED, SITE, days=2, tzinfo=TZ)[1:]
+    assert tomorrow.low_f == 40.0
+    assert tomorrow.precip_type is None